@@ -1,27 +1,48 @@
 # apps/api/main.py
 # 功能：简单的API服务器，为前端UI提供数据接口
-from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, Header, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
 import sys
 import os
 import asyncio
-import json
+import orjson
+import re
+import csv
+import codecs
 import traceback
 import time
 import shutil
-from functools import wraps
+import threading
+import itertools
+import math
+import heapq
+from functools import wraps, lru_cache
+from operator import itemgetter
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent.parent
+PLATFORM_PLUGINS_DIR = project_root / "core" / "platform" / "plugins"
+STRATEGY_PLUGINS_DIR = project_root / "core" / "strategy" / "plugins"
+OLD_LOGS_DIR = project_root / "old" / "logs"
+STATE_DIR = project_root / "state"
+OLD_STATE_DIR = project_root / "old" / "state"
+PROFILES_DIR = project_root / "profiles"
+# /api/logs/file 允许读取的日志目录
+LOG_FILE_DIRS = (
+    project_root / "logs",
+    OLD_LOGS_DIR
+)
 sys.path.insert(0, str(project_root))
 
 from core.managers.platform_manager import get_platform_manager
 from core.managers.strategy_manager import get_strategy_manager
+from core.strategy.base import StrategyStatus
 from core.state_store import get_state_manager
 from core.utils.plugin_loader import get_plugin_loader
 from core.logger import logger
@@ -79,7 +100,8 @@ def handle_api_errors(func):
 app = FastAPI(
     title="Stock Trading API",
     description="API服务为股票交易系统前端提供数据接口",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # 使用orjson序列化响应，比标准库json快数倍
 )
 
 # 添加CORS支持
@@ -101,24 +123,38 @@ plugin_loader = get_plugin_loader()
 from core.execute.strategy_engine import get_strategy_engine
 strategy_engine = get_strategy_engine()
 
+# 每个日志连接的待发送消息队列长度，客户端过慢时丢弃最旧的消息
+LOG_SEND_QUEUE_SIZE = 256
+# 广播时每批并发发送的连接数，批次之间让出事件循环
+BROADCAST_BATCH_SIZE = 50
+# /ws状态推送帧的复用时长（与推送间隔一致），连接数不变时空闲推送不再重新编码
+STATUS_FRAME_TTL = 5.0
+
 # 存储WebSocket连接
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.log_connections: List[WebSocket] = []  # 专门用于日志推送
+        # 连接集合用dict保存：保持连接先后顺序，增删均为O(1)
+        self.active_connections: Dict[WebSocket, None] = {}
+        # 专门用于日志推送：连接 -> 待发送消息队列，由每个连接自己的发送任务消费
+        self.log_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._log_senders: Dict[WebSocket, asyncio.Task] = {}
         self.max_connections = 50  # 限制最大连接数
         self.connection_metadata = {}  # 存储连接元数据
+        self._stats_cache = (0.0, None)  # 连接统计快照：(生成时间, 统计结果)，连接增减时清空
+        self._status_frame_cache = (0.0, -1, "")  # /ws状态推送帧：(生成时间, 连接数, 已编码文本)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         if len(self.active_connections) >= self.max_connections:
             # 移除最老的连接
-            oldest = self.active_connections.pop(0)
+            oldest = next(iter(self.active_connections))
+            del self.active_connections[oldest]
             try:
                 await oldest.close()
             except:
                 pass
-        self.active_connections.append(websocket)
+        self.active_connections[websocket] = None
+        self._stats_cache = (0.0, None)
 
     async def connect_log(self, websocket: WebSocket):
         """连接日志WebSocket - 增强版本"""
@@ -127,13 +163,16 @@ class ConnectionManager:
             
             # 限制连接数，防止资源耗尽
             if len(self.log_connections) >= self.max_connections:
-                oldest = self.log_connections.pop(0)
+                oldest = next(iter(self.log_connections))
+                self.disconnect(oldest)
                 try:
                     await oldest.close(code=1000, reason="连接数量达到上限")
                 except:
                     pass
                     
-            self.log_connections.append(websocket)
+            queue = asyncio.Queue(maxsize=LOG_SEND_QUEUE_SIZE)
+            self.log_connections[websocket] = queue
+            self._log_senders[websocket] = asyncio.create_task(self._log_sender(websocket, queue))
             
             # 记录连接元数据
             client_info = {
@@ -142,6 +181,7 @@ class ConnectionManager:
                 "last_heartbeat": datetime.now()
             }
             self.connection_metadata[id(websocket)] = client_info
+            self._stats_cache = (0.0, None)
             
             logger.info(f"日志WebSocket客户端已连接，当前总数: {len(self.log_connections)}")
             
@@ -151,11 +191,14 @@ class ConnectionManager:
 
     def disconnect(self, websocket: WebSocket):
         """增强的断开连接处理"""
+        self._stats_cache = (0.0, None)
         try:
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
+            self.active_connections.pop(websocket, None)
             if websocket in self.log_connections:
-                self.log_connections.remove(websocket)
+                del self.log_connections[websocket]
+                sender = self._log_senders.pop(websocket, None)
+                if sender is not None and sender is not asyncio.current_task():
+                    sender.cancel()
                 logger.info(f"日志WebSocket客户端已断开，当前总数: {len(self.log_connections)}")
                 
             # 清理元数据
@@ -189,17 +232,27 @@ class ConnectionManager:
             logger.info(f"清理了 {len(stale_connections)} 个过期连接")
 
     async def broadcast(self, message: dict):
-        """增强的广播功能"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message, ensure_ascii=False))
-            except Exception as e:
-                logger.error(f"WebSocket广播消息失败: {e}")
-                disconnected.append(connection)
+        """增强的广播功能（消息只序列化一次，按批并发发送给所有连接）"""
+        if not self.active_connections:
+            return
+        
+        # 前端按文本帧 JSON.parse，这里保持 send_text
+        payload = json_text(message)
+        connections = tuple(self.active_connections)
+        failed = []
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)  # 批次之间让出事件循环，连接很多时不长时间占用
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in batch),
+                return_exceptions=True
+            )
+            failed.extend((conn, result) for conn, result in zip(batch, results) if isinstance(result, Exception))
         
         # 清理断开的连接
-        for conn in disconnected:
+        for conn, error in failed:
+            logger.error(f"WebSocket广播消息失败: {error}")
             self.disconnect(conn)
 
     async def broadcast_log(self, log_entry: dict):
@@ -207,43 +260,56 @@ class ConnectionManager:
         if not self.log_connections:
             return  # 静默处理，避免控制台噪音
             
-        # 确保消息编码正确
-        message = {
+        # 消息只编码一次，所有连接共用同一个文本帧
+        self._enqueue_log_frame(json_text({
             "type": "log",
             "data": log_entry,
             "timestamp": datetime.now().isoformat()
-        }
-        
-        disconnected = []
-        success_count = 0
-        
-        for connection in self.log_connections:
+        }))
+
+    async def broadcast_log_batch(self, log_entries: List[dict]):
+        """将多条日志合并为一条log_batch消息广播，每个连接只发送一次"""
+        if not self.log_connections or not log_entries:
+            return
+            
+        self._enqueue_log_frame(json_text({
+            "type": "log_batch",
+            "data": log_entries,
+            "total": len(log_entries),
+            "timestamp": datetime.now().isoformat()
+        }))
+
+    def _enqueue_log_frame(self, json_message: str):
+        """将已编码的消息放入每个日志连接的发送队列，不等待发送；队列满时丢弃最旧的一条"""
+        for queue in self.log_connections.values():
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(json_message)
+
+    async def _log_sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """单个日志连接的发送任务：依次发送队列中的消息，发送失败时断开连接"""
+        while True:
+            json_message = await queue.get()
             try:
-                # 使用ensure_ascii=False确保中文正确显示
-                json_message = json.dumps(message, ensure_ascii=False)
-                await connection.send_text(json_message)
-                success_count += 1
-                
-                # 更新心跳时间
-                conn_id = id(connection)
-                if conn_id in self.connection_metadata:
-                    self.connection_metadata[conn_id]["last_heartbeat"] = datetime.now()
-                    
+                await websocket.send_text(json_message)
             except Exception as e:
                 logger.debug(f"WebSocket发送失败，将断开连接: {e}")
-                disconnected.append(connection)
-        
-        # 清理断开的连接
-        for conn in disconnected:
-            self.disconnect(conn)
+                self.disconnect(websocket)
+                return
             
-        # 只在有异常时记录日志
-        if disconnected:
-            logger.warning(f"清理了 {len(disconnected)} 个断开的WebSocket连接")
+            # 更新心跳时间
+            metadata = self.connection_metadata.get(id(websocket))
+            if metadata is not None:
+                metadata["last_heartbeat"] = datetime.now()
 
     def get_connection_stats(self):
-        """获取连接统计信息"""
-        return {
+        """获取连接统计信息（1秒内的重复查询直接返回上次的快照）"""
+        now = time.monotonic()
+        cached_at, cached_stats = self._stats_cache
+        if cached_stats is not None and now - cached_at < 1.0:
+            return cached_stats
+        
+        stats = {
             "total_connections": len(self.log_connections),
             "active_connections": len(self.active_connections),
             "max_connections": self.max_connections,
@@ -257,22 +323,260 @@ class ConnectionManager:
                 for conn_id, info in self.connection_metadata.items()
             ]
         }
+        self._stats_cache = (now, stats)
+        return stats
+
+    def get_status_update_text(self) -> str:
+        """生成/ws定期推送的状态消息文本；各连接推送内容相同，STATUS_FRAME_TTL内且连接数不变时复用已编码的文本"""
+        now = time.monotonic()
+        connection_count = len(self.active_connections)
+        cached_at, cached_count, cached_text = self._status_frame_cache
+        if cached_count == connection_count and now - cached_at < STATUS_FRAME_TTL:
+            return cached_text
+        
+        now_iso = datetime.now().isoformat()
+        text = json_text({
+            "type": "status_update",
+            "data": {
+                "timestamp": now_iso,
+                "active_connections": connection_count
+            },
+            "timestamp": now_iso
+        })
+        self._status_frame_cache = (now, connection_count, text)
+        return text
 
 manager = ConnectionManager()
 
 # 设置WebSocket日志推送
-setup_websocket_logging(logger, manager.broadcast_log)
+websocket_log_handler = setup_websocket_logging(logger, manager.broadcast_log)
 
 # 全局工具函数
+# 注意：以下文件读写函数是阻塞调用，异步接口中通过 asyncio.to_thread 调用，避免阻塞事件循环
 def deep_merge(target, source):
-    """深度合并字典，保留target中source没有的键"""
-    for key, value in source.items():
-        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-            deep_merge(target[key], value)
-        else:
-            target[key] = value
+    """深度合并字典，保留target中source没有的键（使用显式栈迭代，避免递归开销）"""
+    stack = [(target, source)]
+    while stack:
+        current_target, current_source = stack.pop()
+        for key, value in current_source.items():
+            existing = current_target.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                stack.append((existing, value))
+            else:
+                current_target[key] = value
     return target
 
+# JSON文件内容缓存：路径 -> ((mtime_ns, size), 原始字节)
+# 缓存的是字节而非dict，每次读取都用orjson重新解析得到全新对象，调用方可以放心修改返回值
+_JSON_FILE_CACHE: Dict[str, tuple] = {}
+
+def read_json_file(path) -> Any:
+    """读取JSON文件（兼容带BOM的旧文件），文件未变化时跳过磁盘读取"""
+    key = os.fspath(path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_FILE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return orjson.loads(cached[1])
+    
+    with open(key, 'rb') as f:
+        data = f.read()
+    if data[:3] == b'\xef\xbb\xbf':
+        data = data[3:]
+    result = orjson.loads(data)
+    _JSON_FILE_CACHE[key] = (signature, data)
+    return result
+
+# runtime.log 行格式，文件信息段可选：
+# 2025-10-03 01:37:40 - INFO - [logger.py:info:73] - message
+# 2025-10-03 01:37:40,123 - INFO - message
+RUNTIME_LOG_LINE_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?:,\d+)? - (\w+)(?: - \[.*?\])? - (.+)')
+
+# 日志行开头的时间戳（如 2025-10-03 01:37:40）
+LOG_TIMESTAMP_PREFIX_RE = re.compile(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}')
+
+# /api/logs/file 允许的相对路径字符（排除反斜杠、盘符、NUL、URL编码等）
+LOG_FILE_PATH_RE = re.compile(r'[A-Za-z0-9_\-./]+')
+
+# 交易CSV日志文件名（log_YYYYMMDD.csv），一次C层匹配代替前后缀两次判断
+TRADE_LOG_NAME_RE = re.compile(r'log_.*\.csv', re.DOTALL)
+
+def tail_lines(path, n: int, block_size: int = 8192) -> List[str]:
+    """读取文本文件末尾n行：从文件末尾按块向前读取，块不够时加倍，不读取整个文件"""
+    if n <= 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        read_size = min(size, max(block_size, n * 200))
+        while True:
+            f.seek(size - read_size)
+            data = f.read(read_size)
+            # 需要比n多一个换行，才能保证块内第一行是完整的
+            if read_size >= size or data.count(b'\n') > n:
+                break
+            read_size = min(size, read_size * 2)
+    lines = data.decode('utf-8', errors='ignore').split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    if read_size < size:
+        lines = lines[1:]  # 丢弃被截断的第一行
+    return lines[-n:]
+
+def json_text(data: Any) -> str:
+    """序列化为JSON文本（用于WebSocket文本帧，中文原样输出）"""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def file_etag(file_stat: os.stat_result) -> str:
+    """根据文件mtime和大小生成弱ETag"""
+    return f'W/"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """判断请求的 If-None-Match 是否包含当前ETag"""
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+# 备份文件后缀序号：同一秒内多次备份也不会互相覆盖
+_BACKUP_SEQ = itertools.count()
+
+def backup_suffix() -> str:
+    """生成备份文件后缀：秒级时间戳 + 进程内递增序号"""
+    return f"{int(time.time())}.{next(_BACKUP_SEQ)}"
+
+def write_json_file(path, data: Any):
+    """将数据格式化为JSON并原子写入文件（先写临时文件再替换，读取方不会看到写了一半的内容）"""
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# 本进程中已确认存在的目录，避免每次写配置都调用makedirs
+_ENSURED_DIRS = set()
+
+def ensure_dir(path):
+    """确保目录存在（每个目录在进程内只创建/检查一次）"""
+    key = os.fspath(path)
+    if key in _ENSURED_DIRS:
+        return
+    os.makedirs(key, exist_ok=True)
+    _ENSURED_DIRS.add(key)
+
+# 目录扫描缓存（profiles目录、平台插件等）：记录扫描依赖的目录/文件mtime，均未变化时直接复用扫描结果
+_PROFILES_SCAN_CACHE: Dict[str, Dict[str, Any]] = {}
+
+def _mtime_signature(paths) -> Optional[tuple]:
+    """获取一组路径的mtime签名，任一路径不存在时返回None"""
+    try:
+        return tuple(os.stat(path).st_mtime_ns for path in paths)
+    except OSError:
+        return None
+
+def get_cached_profiles_scan(key: str):
+    """返回仍然有效的扫描结果，已失效时返回None"""
+    entry = _PROFILES_SCAN_CACHE.get(key)
+    if entry and _mtime_signature(entry["paths"]) == entry["signature"]:
+        return entry["result"]
+    return None
+
+def store_profiles_scan(key: str, watched: Dict[str, int], result):
+    """保存扫描结果，watched为扫描时读取到的 路径->mtime"""
+    _PROFILES_SCAN_CACHE[key] = {
+        "paths": tuple(watched),
+        "signature": tuple(watched.values()),
+        "result": result
+    }
+
+# 账号索引：随profiles扫描一起重建
+# ACCOUNT_INDEX: account_id -> {平台目录名: profile}
+# ACCOUNTS_BY_PLATFORM: 平台名(小写) -> 该平台下的账号列表
+ACCOUNT_INDEX: Dict[str, Dict[str, Dict[str, Any]]] = {}
+ACCOUNTS_BY_PLATFORM: Dict[str, List[Dict[str, Any]]] = {}
+
+async def ensure_account_index() -> List[Dict[str, Any]]:
+    """确保账号索引为最新（profiles目录或profile.json变化时重新扫描），返回全部账号"""
+    accounts = get_cached_profiles_scan("accounts")
+    if accounts is None:
+        accounts = await asyncio.to_thread(scan_profile_accounts, os.fspath(PROFILES_DIR))
+    return accounts
+
+# 配置写入合并：短时间内对同一配置文件的多次更新先在内存中合并，延迟后一次性写盘
+CONFIG_FLUSH_DELAY = 0.1  # 秒
+_pending_config_writes: Dict[str, Dict[str, Any]] = {}
+_config_flush_tasks: Dict[str, asyncio.Task] = {}
+_config_locks: Dict[str, asyncio.Lock] = {}
+
+def _config_lock(config_path: str) -> asyncio.Lock:
+    return _config_locks.setdefault(config_path, asyncio.Lock())
+
+async def queue_config_update(config_path: str, parameters: dict) -> bool:
+    """将参数合并到待写入的配置中，并安排延迟写盘；内容未变化时返回False"""
+    async with _config_lock(config_path):
+        existing_config = _pending_config_writes.get(config_path)
+        if existing_config is None:
+            existing_config = {}
+            file_exists = True
+            try:
+                existing_config = await asyncio.to_thread(read_json_file, config_path)
+            except FileNotFoundError:
+                file_exists = False
+            except Exception as e:
+                logger.log_warning(f"Failed to read existing config: {e}")
+            
+            # 与磁盘内容相同的重复更新不产生写入
+            before = orjson.dumps(existing_config)
+            deep_merge(existing_config, parameters)
+            if file_exists and orjson.dumps(existing_config) == before:
+                return False
+            _pending_config_writes[config_path] = existing_config
+        else:
+            deep_merge(existing_config, parameters)
+        
+        if config_path not in _config_flush_tasks:
+            _config_flush_tasks[config_path] = asyncio.create_task(
+                _flush_config_later(config_path, CONFIG_FLUSH_DELAY)
+            )
+        return True
+
+async def _flush_config_later(config_path: str, delay: float):
+    await asyncio.sleep(delay)
+    await flush_config_write(config_path)
+
+async def flush_config_write(config_path: str) -> Optional[str]:
+    """立即写出指定配置文件的待写入内容；写入失败时内容保留在待写入队列中，返回错误信息"""
+    async with _config_lock(config_path):
+        return await _write_pending_config(config_path)
+
+async def _write_pending_config(config_path: str) -> Optional[str]:
+    """写出待写入内容（调用方需已持有该配置文件的锁）"""
+    _config_flush_tasks.pop(config_path, None)
+    existing_config = _pending_config_writes.pop(config_path, None)
+    if existing_config is None:
+        return None
+    try:
+        await asyncio.to_thread(write_json_file, config_path, existing_config)
+        logger.log_info(f"Configuration updated: {config_path}")
+        return None
+    except Exception as e:
+        logger.log_error(f"写入配置文件失败 {config_path}: {e}")
+        # 保留未写出的内容，由下次 /api/config/flush 或关闭时重试
+        _pending_config_writes.setdefault(config_path, existing_config)
+        return str(e)
+
+async def flush_pending_config_writes() -> Dict[str, str]:
+    """立即写出所有待写入的配置，返回写入失败的 {配置路径: 错误信息}"""
+    paths = list(_pending_config_writes)
+    errors = await asyncio.gather(*(flush_config_write(path) for path in paths))
+    return {path: error for path, error in zip(paths, errors) if error}
+
 # 应用生命周期事件
 @app.on_event("startup")
 async def startup_event():
@@ -282,6 +586,8 @@ async def startup_event():
     
     # 测试WebSocket日志系统
     print("[系统启动] 初始化WebSocket日志系统...")
+    # 记录事件循环，工作线程（asyncio.to_thread）中的日志也能推送到前端
+    websocket_log_handler.set_event_loop(asyncio.get_running_loop())
     logger.log_info("🔌 WebSocket日志系统已初始化")
     logger.log_info("📡 等待前端连接到 ws://localhost:8001/ws/logs")
     
@@ -289,6 +595,21 @@ async def startup_event():
     asyncio.create_task(periodic_cleanup_task())
     logger.log_info("🧹 WebSocket连接清理任务已启动")
     
+    # 预先建立账号索引
+    try:
+        accounts = await ensure_account_index()
+        logger.log_info(f"📇 账号索引已建立，共{len(accounts)}个账号")
+    except Exception as e:
+        logger.log_error(f"建立账号索引失败: {e}")
+    
+    # 预先建立策略列表及模板索引，之后只在文件变化时重新解析
+    try:
+        await get_available_strategies()
+        for strategy_name in plugin_loader.list_available_strategies():
+            plugin_loader.scan_strategy_templates(strategy_name)
+    except Exception as e:
+        logger.log_error(f"建立策略模板索引失败: {e}")
+    
     # 手动调用策略管理器的自动启动方法
     try:
         logger.log_info("🔄 调用策略管理器自动启动方法...")
@@ -296,7 +617,6 @@ async def startup_event():
         logger.log_info("✅ 策略自动启动检查完成")
     except Exception as e:
         logger.log_error(f"❌ 策略自动启动失败: {e}")
-        import traceback
         logger.log_error(f"详细错误: {traceback.format_exc()}")
 
 @app.on_event("shutdown")
@@ -304,14 +624,19 @@ async def shutdown_event():
     """应用关闭事件"""
     logger.log_info("🛑 API服务器正在关闭...")
     
+    # 写出尚未落盘的配置更新
+    failed = await flush_pending_config_writes()
+    if failed:
+        logger.log_error(f"关闭前有{len(failed)}个配置未能写入: {', '.join(failed)}")
+    
     # 优雅关闭所有WebSocket连接
-    for websocket in manager.log_connections.copy():
+    for websocket in tuple(manager.log_connections):
         try:
             await websocket.close(code=1001, reason="服务器关闭")
         except:
             pass
     
-    for websocket in manager.active_connections.copy():
+    for websocket in tuple(manager.active_connections):
         try:
             await websocket.close(code=1001, reason="服务器关闭")
         except:
@@ -341,7 +666,6 @@ async def periodic_cleanup_task():
         logger.log_info("✅ 策略执行引擎启动成功")
     except Exception as e:
         logger.log_error(f"❌ 策略执行引擎启动失败: {e}")
-        import traceback
         logger.log_error(f"详细错误: {traceback.format_exc()}")
 
 @app.on_event("shutdown") 
@@ -372,6 +696,28 @@ class ForceStopStrategyRequest(BaseModel):
     account_id: str
     instance_id: str
 
+class UpdateConfigRequest(BaseModel):
+    """通用配置更新请求：使用config_id，或分别指定platform/account/strategy"""
+    config_id: Optional[str] = None
+    platform: Optional[str] = None
+    account: Optional[str] = None
+    strategy: Optional[str] = None
+    parameters: Dict[str, Any] = {}
+
+    @staticmethod
+    def parse_config_id(config_id: str) -> tuple:
+        """从配置ID解析 (platform, account, strategy)，格式: PLATFORM_ACCOUNT_STRATEGY"""
+        parts = config_id.split("_", 2)  # 策略名可能包含下划线
+        if len(parts) < 3:
+            raise ValueError(f"Invalid config_id format: {config_id}")
+        return parts[0], parts[1], parts[2]
+
+    def target(self) -> tuple:
+        """返回要更新的 (platform, account, strategy)"""
+        if self.config_id:
+            return self.parse_config_id(self.config_id)
+        return self.platform, self.account, self.strategy
+
 # 缺失功能记录
 MISSING_FEATURES = []
 
@@ -391,48 +737,50 @@ def get_account_owner(account_name: str) -> str:
         accounts_dir = os.path.join(project_root, "accounts")
         
         # 查找账号的API配置文件
-        for platform_dir in os.listdir(accounts_dir):
-            if platform_dir.startswith('_'):
-                continue
-            platform_path = os.path.join(accounts_dir, platform_dir)
-            if os.path.isdir(platform_path):
-                account_path = os.path.join(platform_path, account_name)
-                if os.path.isdir(account_path):
-                    # 查找API配置文件（支持多种命名格式）
-                    api_files = [
-                        f"{platform_dir.lower()}_api.json",  # 如 binance_api.json
-                        "api.json",
-                        "config.json"
-                    ]
+        with os.scandir(accounts_dir) as platform_entries:
+            platform_dirs = [entry for entry in platform_entries
+                             if not entry.name.startswith('_') and entry.is_dir()]
+        for platform_entry in platform_dirs:
+            platform_dir = platform_entry.name
+            account_path = os.path.join(platform_entry.path, account_name)
+            if os.path.isdir(account_path):
+                # 查找API配置文件（支持多种命名格式）
+                api_files = [
+                    f"{platform_dir.lower()}_api.json",  # 如 binance_api.json
+                    "api.json",
+                    "config.json"
+                ]
                     
-                    for api_file in api_files:
-                        api_file_path = os.path.join(account_path, api_file)
-                        if os.path.exists(api_file_path):
-                            with open(api_file_path, 'r', encoding='utf-8-sig') as f:
-                                api_config = json.load(f)
-                                owner = api_config.get('owner')
-                                if owner:
-                                    logger.log_info(f"Found owner '{owner}' for account {account_name} in {api_file}")
-                                    return owner
+                for api_file in api_files:
+                    api_file_path = os.path.join(account_path, api_file)
+                    # 直接读取，文件不存在时跳过（不再先exists再读取）
+                    try:
+                        api_config = read_json_file(api_file_path)
+                    except FileNotFoundError:
+                        continue
+                    owner = api_config.get('owner')
+                    if owner:
+                        logger.log_info(f"Found owner '{owner}' for account {account_name} in {api_file}")
+                        return owner
         
         # 方法2：从profile.json读取拥有人信息（向后兼容）
-        profiles_dir = os.path.join(project_root, "profiles")
-        
-        for platform_dir in os.listdir(profiles_dir):
-            if platform_dir.startswith('_'):
-                continue
-            platform_path = os.path.join(profiles_dir, platform_dir)
-            if os.path.isdir(platform_path):
-                account_path = os.path.join(platform_path, account_name)
-                if os.path.isdir(account_path):
-                    profile_file = os.path.join(account_path, 'profile.json')
-                    if os.path.exists(profile_file):
-                        with open(profile_file, 'r', encoding='utf-8-sig') as f:
-                            profile = json.load(f)
-                            owner = profile.get('profile_info', {}).get('owner')
-                            if owner:
-                                logger.log_info(f"Found owner '{owner}' for account {account_name} in profile.json (fallback)")
-                                return owner
+        profiles_dir = os.fspath(PROFILES_DIR)
+        
+        with os.scandir(profiles_dir) as platform_entries:
+            platform_dirs = [entry for entry in platform_entries
+                             if not entry.name.startswith('_') and entry.is_dir()]
+        for platform_entry in platform_dirs:
+            account_path = os.path.join(platform_entry.path, account_name)
+            if os.path.isdir(account_path):
+                profile_file = os.path.join(account_path, 'profile.json')
+                try:
+                    profile = read_json_file(profile_file)
+                except FileNotFoundError:
+                    continue
+                owner = profile.get('profile_info', {}).get('owner')
+                if owner:
+                    logger.log_info(f"Found owner '{owner}' for account {account_name} in profile.json (fallback)")
+                    return owner
         
         # 方法3：使用默认规则（最后的后备方案）
         if account_name == 'BN2055':
@@ -449,88 +797,165 @@ def get_account_owner(account_name: str) -> str:
         else:
             return '潘正友'
 
+def resolve_account_owners(account_names) -> Dict[str, str]:
+    """批量查询账号拥有人，返回 {account_name: owner}（同步函数，供 asyncio.to_thread 调用）"""
+    return {account_name: get_account_owner(account_name) for account_name in account_names}
+
 @app.get("/")
 async def root():
     """根路径"""
     return {"message": "Stock Trading API", "version": "1.0.0"}
 
+@lru_cache(maxsize=256)
+def summarize_trade_log(csv_path: str, mtime_ns: int, size: int) -> tuple:
+    """统计交易CSV日志的盈亏合计、交易笔数和盈利笔数，返回 (total_profit, total_trades, profitable_trades)
+    
+    mtime_ns和size作为缓存键的一部分，文件未变化时直接复用上次的统计结果
+    """
+    total_profit = 0.0
+    total_trades = 0
+    profitable_trades = 0
+    isfinite = math.isfinite  # 循环内使用局部名，省去每行的属性查找
+    # csv.reader 在C层逐行切分字段，流式读取文件，不再先readlines再逐行split
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip header
+        for parts in reader:
+            if len(parts) < 17:  # Ensure we have profit column
+                continue
+            total_trades += 1
+            # 盈亏金额 column：直接交给float解析（支持+号和科学计数法），空值/非数字跳过
+            try:
+                profit = float(parts[16])
+            except ValueError:
+                continue
+            if profit and isfinite(profit):
+                total_profit += profit
+                if profit > 0:
+                    profitable_trades += 1
+    return total_profit, total_trades, profitable_trades
+
+def scan_platform_trade_logs(platform_path: str) -> tuple:
+    """统计单个平台目录下所有交易CSV日志，返回 (total_profit, total_trades, profitable_trades)（同步函数，供 asyncio.to_thread 调用）"""
+    total_profit = 0.0
+    total_trades = 0
+    profitable_trades = 0
+    with os.scandir(platform_path) as entries:
+        csv_entries = [entry for entry in entries
+                       if TRADE_LOG_NAME_RE.fullmatch(entry.name)]
+    for csv_entry in csv_entries:
+        log_file = csv_entry.name
+        try:
+            # 按文件mtime和大小缓存统计结果，只重新解析新增或修改过的CSV
+            csv_stat = csv_entry.stat()
+            profit, trades, profitable = summarize_trade_log(csv_entry.path, csv_stat.st_mtime_ns, csv_stat.st_size)
+            total_profit += profit
+            total_trades += trades
+            profitable_trades += profitable
+        except Exception as e:
+            logger.log_error(f"Error reading trading log {log_file}: {e}")
+    return total_profit, total_trades, profitable_trades
+
+def list_trade_log_platform_dirs(old_logs_dir: Path) -> List[str]:
+    """列出日志根目录下的各平台目录（同步函数，供 asyncio.to_thread 调用）"""
+    try:
+        with os.scandir(old_logs_dir) as entries:
+            return [entry.path for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+async def collect_trade_log_totals(old_logs_dir: Path) -> tuple:
+    """统计各平台的交易CSV日志，返回 (total_profit, total_trades, profitable_trades)
+    
+    每个平台目录各占一个线程并行扫描，避免阻塞事件循环
+    """
+    total_profit = 0.0
+    total_trades = 0
+    profitable_trades = 0
+    platform_paths = await asyncio.to_thread(list_trade_log_platform_dirs, old_logs_dir)
+    platform_totals = await asyncio.gather(
+        *(asyncio.to_thread(scan_platform_trade_logs, platform_path) for platform_path in platform_paths)
+    )
+    for profit, trades, profitable in platform_totals:
+        total_profit += profit
+        total_trades += trades
+        profitable_trades += profitable
+    return total_profit, total_trades, profitable_trades
+
+def scan_state_dirs(state_dir: Path, old_state_dir: Path) -> tuple:
+    """统计状态目录中的活跃实例数和持仓金额，返回 (active_instances, total_balance)（同步函数，供 asyncio.to_thread 调用）
+    
+    结果写入扫描缓存：实例目录的增删、state.json的创建/删除会改变所在目录的mtime，
+    旧状态文件内容变化会改变文件自身的mtime，均未变化时仪表板直接复用上次的统计
+    """
+    active_instances = 0
+    total_balance = 0.0
+    watched = {}
+    
+    # Count active instances from state directories
+    # 目录/文件不存在时直接捕获FileNotFoundError，不再先exists再访问
+    try:
+        watched[state_dir] = os.stat(state_dir).st_mtime_ns
+        with os.scandir(state_dir) as entries:
+            item_entries = [entry for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        item_entries = []
+    for item_entry in item_entries:
+        watched[item_entry.path] = item_entry.stat().st_mtime_ns
+        if os.path.isfile(os.path.join(item_entry.path, 'state.json')):
+            active_instances += 1
+
+    # Also check old state directory
+    try:
+        watched[old_state_dir] = os.stat(old_state_dir).st_mtime_ns
+        with os.scandir(old_state_dir) as entries:
+            # Skip the main state.json file
+            item_entries = [entry for entry in entries
+                            if not entry.name.endswith('.json') and entry.is_dir()]
+    except FileNotFoundError:
+        item_entries = []
+    for item_entry in item_entries:
+        watched[item_entry.path] = item_entry.stat().st_mtime_ns
+        state_file = os.path.join(item_entry.path, 'state.json')
+        try:
+            watched[state_file] = os.stat(state_file).st_mtime_ns
+            state_data = read_json_file(state_file)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.log_error(f"Error reading state file: {e}")
+            continue
+        if state_data:  # If state file has data, consider it active
+            active_instances += 1
+            # Extract balance information if available
+            if 'long' in state_data and 'qty' in state_data['long']:
+                total_balance += state_data['long'].get('qty', 0) * state_data['long'].get('avg_price', 0)
+            if 'short' in state_data and 'qty' in state_data['short']:
+                total_balance += state_data['short'].get('qty', 0) * state_data['short'].get('avg_price', 0)
+    
+    # 目录不存在时无法监视其创建，不缓存，下次请求重新扫描
+    if state_dir in watched and old_state_dir in watched:
+        store_profiles_scan("state_dirs", watched, (active_instances, total_balance))
+    return active_instances, total_balance
+
+def load_state_totals(state_dir: Path, old_state_dir: Path) -> tuple:
+    """返回状态目录统计，目录及状态文件均未变化时复用缓存（同步函数，供 asyncio.to_thread 调用）"""
+    cached = get_cached_profiles_scan("state_dirs")
+    if cached is not None:
+        return cached
+    return scan_state_dirs(state_dir, old_state_dir)
+
 @app.get("/api/dashboard/summary")
 async def get_dashboard_summary():
     """获取仪表板摘要数据 - 基于真实交易数据"""
     try:
-        import os
-        import json
-        
-        total_profit = 0.0
-        total_trades = 0
-        total_balance = 0.0
-        active_instances = 0
-        
-        # Calculate profit from trading logs
-        old_logs_dir = "d:/Desktop/Stock-trading/old/logs"
-        if os.path.exists(old_logs_dir):
-            for platform_dir in os.listdir(old_logs_dir):
-                platform_path = os.path.join(old_logs_dir, platform_dir)
-                if os.path.isdir(platform_path):
-                    for log_file in os.listdir(platform_path):
-                        if log_file.endswith('.csv') and log_file.startswith('log_'):
-                            try:
-                                csv_path = os.path.join(platform_path, log_file)
-                                with open(csv_path, 'r', encoding='utf-8') as f:
-                                    lines = f.readlines()
-                                    for line in lines[1:]:  # Skip header
-                                        parts = line.strip().split(',')
-                                        if len(parts) >= 17:  # Ensure we have profit column
-                                            action = parts[3]
-                                            profit_str = parts[16]  # 盈亏金额 column
-                                            
-                                            if profit_str and profit_str.replace('-', '').replace('.', '').isdigit():
-                                                try:
-                                                    profit = float(profit_str)
-                                                    if profit != 0:
-                                                        total_profit += profit
-                                                except:
-                                                    pass
-                                            
-                                            total_trades += 1
-                            except Exception as e:
-                                logger.log_error(f"Error reading trading log {log_file}: {e}")
-        
-        # Count active instances from state directories
-        state_dir = "d:/Desktop/Stock-trading/state"
-        if os.path.exists(state_dir):
-            for item in os.listdir(state_dir):
-                item_path = os.path.join(state_dir, item)
-                if os.path.isdir(item_path):
-                    state_file = os.path.join(item_path, 'state.json')
-                    if os.path.exists(state_file):
-                        active_instances += 1
-        
-        # Also check old state directory
-        old_state_dir = "d:/Desktop/Stock-trading/old/state"
-        if os.path.exists(old_state_dir):
-            for item in os.listdir(old_state_dir):
-                if item.endswith('.json'):
-                    continue  # Skip the main state.json file
-                item_path = os.path.join(old_state_dir, item)
-                if os.path.isdir(item_path):
-                    state_file = os.path.join(item_path, 'state.json')
-                    if os.path.exists(state_file):
-                        try:
-                            with open(state_file, 'r') as f:
-                                state_data = json.load(f)
-                                if state_data:  # If state file has data, consider it active
-                                    active_instances += 1
-                                    # Extract balance information if available
-                                    if 'long' in state_data and 'qty' in state_data['long']:
-                                        total_balance += state_data['long'].get('qty', 0) * state_data['long'].get('avg_price', 0)
-                                    if 'short' in state_data and 'qty' in state_data['short']:
-                                        total_balance += state_data['short'].get('qty', 0) * state_data['short'].get('avg_price', 0)
-                        except Exception as e:
-                            logger.log_error(f"Error reading state file: {e}")
+        # 交易日志统计（各平台各一个线程）与状态目录统计互不依赖，同时进行，耗时取两者较长者
+        (total_profit, total_trades, profitable_trades), (active_instances, total_balance) = await asyncio.gather(
+            collect_trade_log_totals(OLD_LOGS_DIR),
+            asyncio.to_thread(load_state_totals, STATE_DIR, OLD_STATE_DIR)
+        )
         
-        # Calculate success rate based on profitable trades
-        profitable_trades = sum(1 for _ in range(int(total_trades * 0.6)))  # Rough estimate
+        # Calculate success rate based on profitable trades (counted while parsing the CSV logs)
         success_rate = (profitable_trades / max(1, total_trades)) * 100 if total_trades > 0 else 0
         
         return {
@@ -619,6 +1044,12 @@ async def get_running_instances():
             logger.log_error(f"Failed to get strategy instances: {e}")
             all_strategies = []
         
+        # 拥有人信息需读取账号配置文件，按账号去重后在线程中批量查询，避免阻塞事件循环
+        account_owners = await asyncio.to_thread(
+            resolve_account_owners,
+            {getattr(strategy_instance, 'account', 'unknown') for strategy_instance in all_strategies}
+        )
+        
         for strategy_instance in all_strategies:
             try:
                 # 标准化数据格式
@@ -637,7 +1068,7 @@ async def get_running_instances():
                     "last_signal": getattr(strategy_instance, 'last_signal_time', None),
                     "created_at": getattr(strategy_instance, 'created_at', datetime.now().isoformat()),
                     "pid": getattr(strategy_instance, 'pid', None),
-                    "owner": get_account_owner(getattr(strategy_instance, 'account', 'unknown'))
+                    "owner": account_owners[getattr(strategy_instance, 'account', 'unknown')]
                 }
                 
                 # 兼容字段
@@ -760,7 +1191,7 @@ async def update_instance_parameters(instance_name: str, parameters: dict):
     """更新指定运行实例的参数"""
     try:
         logger.log_info(f"收到参数更新请求 - 实例: {instance_name}")
-        logger.log_info(f"收到的参数: {json.dumps(parameters, indent=2, ensure_ascii=False)}")
+        logger.log_info(f"收到的参数字段: {list(parameters.keys())}")
         
         # 获取活跃策略
         active_strategies = strategy_manager.get_active_strategies()
@@ -800,47 +1231,38 @@ async def update_instance_parameters(instance_name: str, parameters: dict):
         # 保存参数到配置文件
         try:
             # 构建配置文件路径
-            if platform.upper() == 'BINANCE':
-                config_path = f"profiles/BINANCE/{account}/strategies/{strategy_name}.json"
-            elif platform.upper() == 'COINW':
-                config_path = f"profiles/COINW/{account}/strategies/{strategy_name}.json"
-            elif platform.upper() == 'OKX':
-                config_path = f"profiles/OKX/{account}/strategies/{strategy_name}.json"
-            else:
-                config_path = f"profiles/{platform.upper()}/{account}/strategies/{strategy_name}.json"
+            config_path = f"profiles/{platform.upper()}/{account}/strategies/{strategy_name}.json"
             
             logger.log_info(f"保存配置到文件: {config_path}")
             
             # 确保目录存在
-            os.makedirs(os.path.dirname(config_path), exist_ok=True)
+            ensure_dir(os.path.dirname(config_path))
             
-            # 读取现有配置文件，如果存在的话
-            existing_config = {}
-            if os.path.exists(config_path):
+            # 持有该配置文件的锁完成“写出待写入内容-读取-合并-写入”，期间的合并更新不会覆盖本次写入
+            async with _config_lock(config_path):
+                # 先写出该文件尚未落盘的合并更新，避免被本次写入覆盖
+                flush_error = await _write_pending_config(config_path)
+                if flush_error:
+                    raise OSError(f"写出待保存的配置失败: {flush_error}")
+            
+                # 读取现有配置文件，如果存在的话
+                existing_config = {}
                 try:
-                    with open(config_path, 'r', encoding='utf-8-sig') as f:
-                        existing_config = json.load(f)
+                    existing_config = await asyncio.to_thread(read_json_file, config_path)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     logger.log_warning(f"Failed to read existing config: {e}")
             
-            # 深度合并参数，确保autoTrade等关键参数被正确保存
-            logger.log_info(f"合并前的现有配置: {json.dumps(existing_config, indent=2, ensure_ascii=False)}")
-            
-            # 特别处理autoTrade参数，确保它被正确保存
-            if 'autoTrade' in parameters:
-                existing_config['autoTrade'] = parameters['autoTrade']
-                logger.log_info(f"✅ 专门保存autoTrade参数: {parameters['autoTrade']}")
-            
-            # 深度合并其他参数
-            deep_merge(existing_config, parameters)
+                # 深度合并参数（autoTrade等顶层标量参数由deep_merge直接覆盖）
+                deep_merge(existing_config, parameters)
+                if 'autoTrade' in parameters:
+                    logger.log_info(f"✅ 保存autoTrade参数: {parameters['autoTrade']}")
             
-            logger.log_info(f"合并后的最终配置: {json.dumps(existing_config, indent=2, ensure_ascii=False)}")
+                # 保存更新后的配置文件
+                await asyncio.to_thread(write_json_file, config_path, existing_config)
             
-            # 保存更新后的配置文件
-            with open(config_path, 'w', encoding='utf-8-sig') as f:
-                json.dump(existing_config, f, indent=2, ensure_ascii=False)
-            
-            logger.log_info(f"Parameters saved to config file: {config_path}")
+                logger.log_info(f"Parameters saved to config file: {config_path}")
             
         except Exception as save_error:
             logger.log_warning(f"Failed to save parameters to config file: {save_error}")
@@ -860,49 +1282,49 @@ async def update_profile_config(platform: str, account: str, strategy: str, para
     """直接更新配置文件，不依赖运行实例"""
     try:
         logger.log_info(f"直接更新配置文件 - 平台: {platform}, 账户: {account}, 策略: {strategy}")
-        logger.log_info(f"更新参数: {json.dumps(parameters, indent=2, ensure_ascii=False)}")
+        logger.log_info(f"更新参数字段: {list(parameters.keys())}")
         
         # 构建配置文件路径
         config_path = f"profiles/{platform.upper()}/{account}/strategies/{strategy}.json"
         logger.log_info(f"配置文件路径: {config_path}")
         
         # 确保目录存在
-        os.makedirs(os.path.dirname(config_path), exist_ok=True)
+        ensure_dir(os.path.dirname(config_path))
+        
+        # 持有该配置文件的锁完成“写出待写入内容-读取-合并-写入”，期间的合并更新不会覆盖本次写入
+        async with _config_lock(config_path):
+            # 先写出该文件尚未落盘的合并更新，避免被本次写入覆盖
+            flush_error = await _write_pending_config(config_path)
+            if flush_error:
+                raise OSError(f"写出待保存的配置失败: {flush_error}")
         
-        # 读取现有配置文件
-        existing_config = {}
-        if os.path.exists(config_path):
+            # 读取现有配置文件
+            existing_config = {}
+            file_exists = True
             try:
-                with open(config_path, 'r', encoding='utf-8-sig') as f:
-                    existing_config = json.load(f)
+                existing_config = await asyncio.to_thread(read_json_file, config_path)
                 logger.log_info(f"读取到现有配置，共{len(existing_config)}个字段")
+            except FileNotFoundError:
+                file_exists = False
+                logger.log_info("配置文件不存在，将创建新文件")
             except Exception as e:
                 logger.log_warning(f"读取现有配置失败: {e}")
-        else:
-            logger.log_info("配置文件不存在，将创建新文件")
-        
-        # 深度合并参数
-        def deep_merge(target, source):
-            """深度合并字典，保留target中source没有的键"""
-            for key, value in source.items():
-                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                    deep_merge(target[key], value)
-                else:
-                    target[key] = value
-            return target
-        
-        logger.log_info(f"合并前配置: {json.dumps(existing_config, indent=2, ensure_ascii=False)}")
-        
-        # 合并参数
-        deep_merge(existing_config, parameters)
         
-        logger.log_info(f"合并后配置: {json.dumps(existing_config, indent=2, ensure_ascii=False)}")
+            # 合并参数，内容未变化时跳过写盘
+            before = orjson.dumps(existing_config)
+            deep_merge(existing_config, parameters)
+            if file_exists and orjson.dumps(existing_config) == before:
+                logger.log_info(f"配置内容未变化，跳过写入: {config_path}")
+                return {
+                    "success": True,
+                    "message": "no change",
+                    "config_path": config_path
+                }
         
-        # 保存配置文件
-        with open(config_path, 'w', encoding='utf-8-sig') as f:
-            json.dump(existing_config, f, indent=2, ensure_ascii=False)
+            # 保存配置文件
+            await asyncio.to_thread(write_json_file, config_path, existing_config)
         
-        logger.log_info(f"配置文件已成功保存: {config_path}")
+            logger.log_info(f"配置文件已成功保存: {config_path}")
         
         return {
             "success": True,
@@ -915,7 +1337,7 @@ async def update_profile_config(platform: str, account: str, strategy: str, para
         return {"success": False, "error": str(e)}
 
 @app.post("/api/config/update")
-async def update_config_parameters(request_data: dict):
+async def update_config_parameters(request_data: UpdateConfigRequest):
     """
     通用配置更新API - 支持多种更新模式
     
@@ -930,26 +1352,12 @@ async def update_config_parameters(request_data: dict):
     """
     try:
         # 支持两种方式：config_id 或 分别指定 platform/account/strategy
-        if "config_id" in request_data:
-            # 从配置ID解析信息 (格式: PLATFORM_ACCOUNT_STRATEGY)
-            config_id = request_data["config_id"]
-            parts = config_id.split("_")
-            if len(parts) >= 3:
-                platform = parts[0]
-                account = parts[1] 
-                strategy = "_".join(parts[2:])  # 策略名可能包含下划线
-            else:
-                raise ValueError(f"Invalid config_id format: {config_id}")
-        else:
-            # 直接从请求中获取
-            platform = request_data.get("platform")
-            account = request_data.get("account") 
-            strategy = request_data.get("strategy")
+        platform, account, strategy = request_data.target()
             
         if not all([platform, account, strategy]):
             raise ValueError("Missing required fields: platform, account, strategy")
             
-        parameters = request_data.get("parameters", {})
+        parameters = request_data.parameters
         if not parameters:
             raise ValueError("No parameters to update")
         
@@ -957,30 +1365,17 @@ async def update_config_parameters(request_data: dict):
         config_path = f"profiles/{platform.upper()}/{account}/strategies/{strategy}.json"
         
         # 确保目录存在
-        os.makedirs(os.path.dirname(config_path), exist_ok=True)
+        ensure_dir(os.path.dirname(config_path))
         
-        # 读取现有配置文件
-        existing_config = {}
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, 'r', encoding='utf-8-sig') as f:
-                    existing_config = json.load(f)
-            except Exception as e:
-                logger.log_warning(f"Failed to read existing config: {e}")
-        
-        # 使用深度合并更新配置
-        # 使用全局deep_merge函数
-        
-        deep_merge(existing_config, parameters)
-        
-        # 保存更新后的配置文件
-        with open(config_path, 'w', encoding='utf-8-sig') as f:
-            json.dump(existing_config, f, indent=2, ensure_ascii=False)
-        
-        logger.log_info(f"Configuration updated: {config_path}")
+        # 合并到待写入配置，由后台任务在CONFIG_FLUSH_DELAY后统一写盘
+        changed = await queue_config_update(config_path, parameters)
+        if not changed:
+            return {"success": True, "message": "no change", "config_path": config_path}
         
+        # queued 表示内容已进入待写入队列，尚未落盘（写入失败记录日志，可通过 /api/config/flush 确认）
         return {
             "success": True,
+            "queued": True,
             "message": f"Configuration updated for {platform}/{account}/{strategy}",
             "config_path": config_path
         }
@@ -989,80 +1384,111 @@ async def update_config_parameters(request_data: dict):
         logger.log_error(f"更新配置文件失败: {e}")
         return {"success": False, "error": str(e)}
 
+def scan_configurations(profiles_dir: str) -> Dict[str, Any]:
+    """扫描profiles目录下所有策略配置文件（同步函数，供 asyncio.to_thread 调用），结果写入扫描缓存"""
+    configs = []
+    # 先记录目录mtime再读取目录内容，扫描期间的改动会使缓存在下次请求时失效
+    watched = {profiles_dir: os.stat(profiles_dir).st_mtime_ns}
+
+    # 遍历所有平台（scandir直接给出条目类型，无需逐个stat）
+    with os.scandir(profiles_dir) as platform_entries:
+        for platform_entry in platform_entries:
+            if not platform_entry.is_dir():
+                continue
+            platform = platform_entry.name
+            watched[platform_entry.path] = platform_entry.stat().st_mtime_ns
+
+            # 遍历所有账号
+            with os.scandir(platform_entry.path) as account_entries:
+                for account_entry in account_entries:
+                    if not account_entry.is_dir():
+                        continue
+                    account = account_entry.name
+                    watched[account_entry.path] = account_entry.stat().st_mtime_ns
+                    strategies_dir = os.path.join(account_entry.path, "strategies")
+
+                    if not os.path.isdir(strategies_dir):
+                        continue
+                    watched[strategies_dir] = os.stat(strategies_dir).st_mtime_ns
+
+                    # 遍历所有策略文件
+                    with os.scandir(strategies_dir) as strategy_entries:
+                        for strategy_entry in strategy_entries:
+                            strategy_file = strategy_entry.name
+                            if strategy_file.endswith('.json'):
+                                strategy_name = strategy_file[:-5]  # 移除.json后缀
+                                config_id = f"{platform}_{account}_{strategy_name}"
+
+                                configs.append({
+                                    "config_id": config_id,
+                                    "platform": platform,
+                                    "account": account,
+                                    "strategy": strategy_name,
+                                    "config_path": strategy_entry.path,
+                                    "exists": strategy_entry.is_file()
+                                })
+
+    result = {
+        "success": True,
+        "configs": configs,
+        "total": len(configs)
+    }
+    store_profiles_scan("configs", watched, result)
+    return result
+
 @app.get("/api/config/list")
 async def list_configurations():
     """获取所有可用的配置文件列表"""
     try:
-        configs = []
         profiles_dir = "profiles"
         
         if not os.path.exists(profiles_dir):
             return {"success": True, "configs": []}
-            
-        # 遍历所有平台
-        for platform in os.listdir(profiles_dir):
-            platform_dir = os.path.join(profiles_dir, platform)
-            if not os.path.isdir(platform_dir):
-                continue
-                
-            # 遍历所有账号
-            for account in os.listdir(platform_dir):
-                account_dir = os.path.join(platform_dir, account)
-                strategies_dir = os.path.join(account_dir, "strategies")
-                
-                if not os.path.isdir(strategies_dir):
-                    continue
-                    
-                # 遍历所有策略文件
-                for strategy_file in os.listdir(strategies_dir):
-                    if strategy_file.endswith('.json'):
-                        strategy_name = strategy_file[:-5]  # 移除.json后缀
-                        config_id = f"{platform}_{account}_{strategy_name}"
-                        config_path = os.path.join(strategies_dir, strategy_file)
-                        
-                        configs.append({
-                            "config_id": config_id,
-                            "platform": platform,
-                            "account": account,
-                            "strategy": strategy_name,
-                            "config_path": config_path,
-                            "exists": os.path.exists(config_path)
-                        })
         
-        return {
-            "success": True,
-            "configs": configs,
-            "total": len(configs)
-        }
+        cached = get_cached_profiles_scan("configs")
+        if cached is not None:
+            return cached
+        
+        # 缓存未命中时在线程中扫描目录，避免阻塞事件循环
+        return await asyncio.to_thread(scan_configurations, profiles_dir)
         
     except Exception as e:
         logger.log_error(f"获取配置列表失败: {e}")
         return {"success": False, "error": str(e)}
 
+@app.post("/api/config/flush")
+async def flush_config_writes():
+    """立即写出所有尚未落盘的配置更新"""
+    try:
+        pending = len(_pending_config_writes)
+        failed = await flush_pending_config_writes()
+        if failed:
+            return {"success": False, "error": "部分配置写入失败", "flushed": pending - len(failed), "failed": failed}
+        return {"success": True, "flushed": pending}
+    except Exception as e:
+        logger.log_error(f"写出配置失败: {e}")
+        return {"success": False, "error": str(e)}
+
 @app.get("/api/config/get")
 async def get_configuration(config_id: str = None, platform: str = None, account: str = None, strategy: str = None):
     """获取指定配置文件内容"""
     try:
         # 支持两种方式获取配置
         if config_id:
-            parts = config_id.split("_")
-            if len(parts) >= 3:
-                platform = parts[0]
-                account = parts[1]
-                strategy = "_".join(parts[2:])
-            else:
-                raise ValueError(f"Invalid config_id format: {config_id}")
+            platform, account, strategy = UpdateConfigRequest.parse_config_id(config_id)
         
         if not all([platform, account, strategy]):
             raise ValueError("Missing required parameters")
             
         config_path = f"profiles/{platform.upper()}/{account}/strategies/{strategy}.json"
         
-        if not os.path.exists(config_path):
-            return {"success": False, "error": "Configuration file not found"}
-            
-        with open(config_path, 'r', encoding='utf-8-sig') as f:
-            config_data = json.load(f)
+        # 优先返回尚未落盘的合并结果
+        config_data = _pending_config_writes.get(config_path)
+        if config_data is None:
+            try:
+                config_data = await asyncio.to_thread(read_json_file, config_path)
+            except FileNotFoundError:
+                return {"success": False, "error": "Configuration file not found"}
             
         return {
             "success": True,
@@ -1075,37 +1501,50 @@ async def get_configuration(config_id: str = None, platform: str = None, account
         logger.log_error(f"获取配置失败: {e}")
         return {"success": False, "error": str(e)}
 
+def scan_platform_plugin_files(platform_plugins_dir) -> tuple:
+    """读取平台插件目录下的插件描述文件（同步函数，供 asyncio.to_thread 调用），返回 (platforms, watched)"""
+    platforms = []
+    watched = {}
+    
+    try:
+        watched[platform_plugins_dir] = os.stat(platform_plugins_dir).st_mtime_ns
+        with os.scandir(platform_plugins_dir) as entries:
+            plugin_entries = [entry for entry in entries if entry.name.endswith('.json')]
+    except FileNotFoundError:
+        plugin_entries = []
+    for entry in plugin_entries:
+        file = entry.name
+        try:
+            watched[entry.path] = entry.stat().st_mtime_ns
+            platform_data = read_json_file(entry.path)
+            platforms.append({
+                "id": platform_data.get("name", file.replace('.json', '')),
+                "name": platform_data.get("display_name", platform_data.get("name", "Unknown")),
+                "description": platform_data.get("description", ""),
+                "version": platform_data.get("version", "1.0.0"),
+                "status": "available",
+                "supported_instruments": platform_data.get("supported_instruments", []),
+                "capabilities": platform_data.get("capabilities", {}),
+                "default_config": platform_data.get("default_config", {}),
+                "required_credentials": platform_data.get("required_credentials", []),
+                "config_schema": platform_data.get("config_schema", {}),
+                "icon": "🟡" if platform_data.get("name") == "binance" else "🔵" if platform_data.get("name") == "coinw" else "⚫"
+            })
+        except Exception as e:
+            logger.log_error(f"Error loading platform {file}: {e}")
+    return platforms, watched
+
 @app.get("/api/platforms/available")
 async def get_available_platforms():
     """获取可用平台列表 - 基于真实平台配置"""
     try:
-        import os
-        import json
+        # 插件文件基本不变，目录及各插件文件mtime未变化时直接返回缓存
+        cached = get_cached_profiles_scan("platforms")
+        if cached is not None:
+            return cached
         
-        platforms = []
-        platform_plugins_dir = "d:/Desktop/Stock-trading/core/platform/plugins"
-        
-        if os.path.exists(platform_plugins_dir):
-            for file in os.listdir(platform_plugins_dir):
-                if file.endswith('.json'):
-                    try:
-                        with open(os.path.join(platform_plugins_dir, file), 'r', encoding='utf-8') as f:
-                            platform_data = json.load(f)
-                            platforms.append({
-                                "id": platform_data.get("name", file.replace('.json', '')),
-                                "name": platform_data.get("display_name", platform_data.get("name", "Unknown")),
-                                "description": platform_data.get("description", ""),
-                                "version": platform_data.get("version", "1.0.0"),
-                                "status": "available",
-                                "supported_instruments": platform_data.get("supported_instruments", []),
-                                "capabilities": platform_data.get("capabilities", {}),
-                                "default_config": platform_data.get("default_config", {}),
-                                "required_credentials": platform_data.get("required_credentials", []),
-                                "config_schema": platform_data.get("config_schema", {}),
-                                "icon": "🟡" if platform_data.get("name") == "binance" else "🔵" if platform_data.get("name") == "coinw" else "⚫"
-                            })
-                    except Exception as e:
-                        logger.log_error(f"Error loading platform {file}: {e}")
+        # 缓存未命中时在线程中读取插件目录，避免阻塞事件循环
+        platforms, watched = await asyncio.to_thread(scan_platform_plugin_files, PLATFORM_PLUGINS_DIR)
         
         # Fallback to plugin_loader if directory method fails
         if not platforms:
@@ -1119,7 +1558,10 @@ async def get_available_platforms():
                     "icon": "🟡" if platform_name == "binance" else "🔵" if platform_name == "coinw" else "⚫"
                 })
 
-        return {"platforms": platforms}
+        result = {"platforms": platforms}
+        if watched:
+            store_profiles_scan("platforms", watched, result)
+        return result
     except Exception as e:
         logger.log_error(f"获取可用平台失败: {e}")
         return {"platforms": []}
@@ -1145,81 +1587,88 @@ async def get_available_accounts(platform: Optional[str] = None):
         logger.log_info(f"=== ACCOUNTS API CALLED ===")
         logger.log_info(f"Platform filter: {platform}")
         
-        accounts = []
-        
-        # 方法2：扫描新的profiles目录获取配置的账号
-        import os
-        # 确保使用正确的profiles目录路径
-        profiles_dir = os.path.join(project_root, "profiles")
-        logger.log_info(f"Checking profiles directory: {profiles_dir}")
-        logger.log_info(f"Current working directory: {os.getcwd()}")
-        logger.log_info(f"Project root: {project_root}")
-        
-        if os.path.exists(profiles_dir):
-            logger.log_info(f"New profiles directory exists, scanning...")
-            # 扫描平台目录 (BINANCE, COINW, OKX, DEEP)
-            for platform_dir in os.listdir(profiles_dir):
-                if platform_dir.startswith('_'):  # 跳过 _shared_defaults
-                    continue
-                platform_path = os.path.join(profiles_dir, platform_dir)
-                if os.path.isdir(platform_path):
-                    logger.log_info(f"Scanning platform: {platform_dir}")
-                    # 扫描账号目录
-                    for account in os.listdir(platform_path):
-                        account_path = os.path.join(platform_path, account)
-                        if os.path.isdir(account_path):
-                            profile_file = os.path.join(account_path, 'profile.json')
-                            logger.log_info(f"Checking profile file: {profile_file}")
-                            if os.path.exists(profile_file):
-                                logger.log_info(f"Profile file exists, reading...")
-                                try:
-                                    with open(profile_file, 'r', encoding='utf-8') as f:
-                                        profile = json.load(f)
-                                        account_platform = profile.get('profile_info', {}).get('platform', 'unknown')
-                                        logger.log_info(f"Loaded profile for {account}, platform: {account_platform}")
-                                        logger.log_info(f"Platform comparison: '{account_platform.lower()}' vs '{platform.lower() if platform else None}'")
-                                        
-                                        # 平台筛选 (不区分大小写)
-                                        if platform is None or account_platform.lower() == platform.lower():
-                                            logger.log_info(f"Platform matches! Adding account {account}")
-                                            # 检查是否已在列表中
-                                            if not any(acc['id'] == account for acc in accounts):
-                                                accounts.append({
-                                                    "id": account,
-                                                    "name": profile.get('profile_info', {}).get('display_name', account),
-                                                    "platform": account_platform,
-                                                    "status": "configured",
-                                                    "balance": 0.0,
-                                                    "last_active": None,
-                                                    "config": profile
-                                                })
-                                            else:
-                                                logger.log_info(f"Account {account} already in list, skipping")
-                                        else:
-                                            logger.log_info(f"Platform mismatch for {account}: '{account_platform}' != '{platform}'")
-                                except Exception as e:
-                                    logger.log_error(f"Failed to read profile for account {account}: {e}")
-                            else:
-                                logger.log_info(f"Profile file not found: {profile_file}")
-                        else:
-                            logger.log_info(f"Not a directory: {account_path}")
-                else:
-                    logger.log_info(f"Not a platform directory: {platform_path}")
+        # 从profiles目录的账号索引中获取配置的账号
+        all_accounts = await ensure_account_index()
+        
+        # 平台筛选 (不区分大小写)
+        if platform is None:
+            accounts = all_accounts
         else:
-            logger.log_error(f"Profiles directory not found: {profiles_dir}")
+            accounts = ACCOUNTS_BY_PLATFORM.get(platform.lower(), [])
         
         logger.log_info(f"Total accounts found: {len(accounts)}")
-        for acc in accounts:
-            logger.log_info(f"Account: {acc['id']}, Platform: {acc['platform']}, Status: {acc['status']}")
         
         return {"accounts": accounts}
         
     except Exception as e:
         logger.log_error(f"获取可用账号失败: {e}")
-        import traceback
         logger.log_error(f"Traceback: {traceback.format_exc()}")
         return {"accounts": []}
 
+def scan_profile_accounts(profiles_dir: str) -> List[Dict[str, Any]]:
+    """扫描profiles目录下所有配置了profile.json的账号（不做平台筛选），重建账号索引并写入扫描缓存"""
+    global ACCOUNT_INDEX, ACCOUNTS_BY_PLATFORM
+    accounts = []
+    index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    by_platform: Dict[str, List[Dict[str, Any]]] = {}
+    platform_seen = set()
+    
+    if not os.path.exists(profiles_dir):
+        logger.log_error(f"Profiles directory not found: {profiles_dir}")
+        return accounts
+    
+    watched = {profiles_dir: os.stat(profiles_dir).st_mtime_ns}
+    # 扫描平台目录 (BINANCE, COINW, OKX, DEEP)
+    with os.scandir(profiles_dir) as entries:
+        platform_entries = [entry for entry in entries if not entry.name.startswith('_')]  # 跳过 _shared_defaults
+    for platform_entry in platform_entries:
+        platform_path = platform_entry.path
+        if platform_entry.is_dir():
+            watched[platform_path] = platform_entry.stat().st_mtime_ns
+            # 扫描账号目录
+            with os.scandir(platform_path) as entries:
+                account_entries = list(entries)
+            for account_entry in account_entries:
+                account = account_entry.name
+                account_path = account_entry.path
+                if account_entry.is_dir():
+                    watched[account_path] = account_entry.stat().st_mtime_ns
+                    profile_file = os.path.join(account_path, 'profile.json')
+                    try:
+                        profile_mtime = os.stat(profile_file).st_mtime_ns
+                    except FileNotFoundError:
+                        profile_mtime = None
+                    if profile_mtime is not None:
+                        watched[profile_file] = profile_mtime
+                        try:
+                            profile = read_json_file(profile_file)
+                            account_platform = profile.get('profile_info', {}).get('platform', 'unknown')
+                            account_entry_data = {
+                                "id": account,
+                                "name": profile.get('profile_info', {}).get('display_name', account),
+                                "platform": account_platform,
+                                "status": "configured",
+                                "balance": 0.0,
+                                "last_active": None,
+                                "config": profile
+                            }
+                            # 同一账号出现在多个平台目录时，列表中只保留第一次出现的
+                            if account not in index:
+                                accounts.append(account_entry_data)
+                            platform_key = str(account_platform).lower()
+                            if (platform_key, account) not in platform_seen:
+                                platform_seen.add((platform_key, account))
+                                by_platform.setdefault(platform_key, []).append(account_entry_data)
+                            index.setdefault(account, {})[platform_entry.name] = profile
+                        except Exception as e:
+                            logger.log_error(f"Failed to read profile for account {account}: {e}")
+    
+    logger.log_info(f"Scanned profiles directory {profiles_dir}: {len(accounts)} accounts")
+    ACCOUNT_INDEX = index
+    ACCOUNTS_BY_PLATFORM = by_platform
+    store_profiles_scan("accounts", watched, accounts)
+    return accounts
+
 @app.get("/api/accounts/{platform}")
 async def get_accounts_by_platform(platform: str):
     """根据平台获取账号列表 - 兼容性端点"""
@@ -1227,13 +1676,11 @@ async def get_accounts_by_platform(platform: str):
         logger.log_info(f"=== PLATFORM ACCOUNTS API CALLED ===")
         logger.log_info(f"Platform: {platform}")
         
-        # 调用通用账号API并按平台筛选
-        result = await get_available_accounts(platform=platform)
-        accounts = result.get("accounts", [])
+        # 直接从按平台划分的账号索引中取
+        await ensure_account_index()
+        accounts = ACCOUNTS_BY_PLATFORM.get(platform.lower(), [])
         
         logger.log_info(f"Found {len(accounts)} accounts for platform {platform}")
-        for acc in accounts:
-            logger.log_info(f"Account: {acc['id']}, Platform: {acc['platform']}, Status: {acc['status']}")
         
         # 直接返回账号数组，与之前的格式保持一致
         return accounts
@@ -1275,37 +1722,22 @@ async def test_account_connection(account_id: str):
 async def test_account_connection_impl(account_id: str, platform_filter: str = None):
     """测试账号平台连接的实现"""
     try:
-        # 首先从新的profiles目录读取账号配置
-        profiles_dir = os.path.join(project_root, "profiles")
-        # 扫描平台目录找到账号
-        account_config_path = None
-        found_platform = None
-        for platform_dir in os.listdir(profiles_dir):
-            if platform_dir.startswith('_'):
-                continue
+        # 从账号索引中查找账号配置
+        await ensure_account_index()
+        profile = None
+        for platform_dir, platform_profile in ACCOUNT_INDEX.get(account_id, {}).items():
             if platform_filter and platform_dir.upper() != platform_filter.upper():
                 continue
-            platform_path = os.path.join(profiles_dir, platform_dir)
-            if os.path.isdir(platform_path):
-                account_path = os.path.join(platform_path, account_id)
-                if os.path.isdir(account_path):
-                    config_file = os.path.join(account_path, 'profile.json')
-                    if os.path.exists(config_file):
-                        account_config_path = config_file
-                        found_platform = platform_dir
-                        break
-        
-        if not account_config_path:
+            profile = platform_profile
+            break
+        
+        if profile is None:
             return {
                 "success": False,
                 "message": f"账号 {account_id} 配置文件不存在",
                 "status": "config_not_found"
             }
         
-        # 读取账号配置
-        with open(account_config_path, 'r', encoding='utf-8') as f:
-            profile = json.load(f)
-        
         config = profile.get('profile_info', {})
         platform_name = config.get('platform')
         if not platform_name:
@@ -1331,8 +1763,7 @@ async def test_account_connection_impl(account_id: str, platform_filter: str = N
             api_config_path = os.path.join(project_root, profile['api_config']['path'])
             if os.path.exists(api_config_path):
                 try:
-                    with open(api_config_path, 'r', encoding='utf-8') as f:
-                        api_config = json.load(f)
+                    api_config = await asyncio.to_thread(read_json_file, api_config_path)
                     api_credentials = api_config
                     # 支持多种字段名格式
                     api_key = (api_config.get('api_key') or 
@@ -1494,39 +1925,52 @@ async def get_account_status(account_id: str):
         add_missing_feature(f"account_status_{account_id}", f"账号{account_id}状态获取功能需要完善")
         raise HTTPException(status_code=500, detail=str(e))
 
+def scan_strategy_plugin_files(strategy_plugins_dir) -> tuple:
+    """读取策略插件目录下的插件描述文件（同步函数，供 asyncio.to_thread 调用），返回 (strategies, watched)"""
+    strategies = []
+    watched = {}
+    
+    try:
+        watched[strategy_plugins_dir] = strategy_plugins_dir.stat().st_mtime_ns
+        with os.scandir(strategy_plugins_dir) as entries:
+            plugin_entries = [entry for entry in entries if entry.name.endswith('.json')]
+    except FileNotFoundError:
+        plugin_entries = []
+    for entry in plugin_entries:
+        file = entry.name
+        try:
+            watched[entry.path] = entry.stat().st_mtime_ns
+            strategy_data = read_json_file(entry.path)
+            strategies.append({
+                "id": strategy_data.get("name", file[:-5]),
+                "name": strategy_data.get("display_name", strategy_data.get("name", "Unknown")),
+                "description": strategy_data.get("description", ""),
+                "version": strategy_data.get("version", "1.0.0"),
+                "category": strategy_data.get("category", "unknown"),
+                "risk_level": strategy_data.get("risk_level", "medium"),
+                "supported_platforms": strategy_data.get("supported_platforms", []),
+                "supported_instruments": strategy_data.get("supported_instruments", []),
+                "default_params": strategy_data.get("default_params", {}),
+                "param_schema": strategy_data.get("param_schema", {}),
+                "risk_warnings": strategy_data.get("risk_warnings", []),
+                "performance_metrics": strategy_data.get("performance_metrics", {}),
+                "metadata": strategy_data.get("metadata", {})
+            })
+        except Exception as e:
+            logger.log_error(f"Error loading strategy {file}: {e}")
+    return strategies, watched
+
 @app.get("/api/strategies/available")
 async def get_available_strategies():
     """获取可用策略列表"""
     try:
-        import os
-        import json
+        # 策略插件文件基本不变，目录及各插件文件mtime未变化时直接返回缓存
+        cached = get_cached_profiles_scan("strategies")
+        if cached is not None:
+            return cached
         
-        strategies = []
-        strategy_plugins_dir = "d:/Desktop/Stock-trading/core/strategy/plugins"
-        
-        if os.path.exists(strategy_plugins_dir):
-            for file in os.listdir(strategy_plugins_dir):
-                if file.endswith('.json'):
-                    try:
-                        with open(os.path.join(strategy_plugins_dir, file), 'r', encoding='utf-8') as f:
-                            strategy_data = json.load(f)
-                            strategies.append({
-                                "id": strategy_data.get("name", file.replace('.json', '')),
-                                "name": strategy_data.get("display_name", strategy_data.get("name", "Unknown")),
-                                "description": strategy_data.get("description", ""),
-                                "version": strategy_data.get("version", "1.0.0"),
-                                "category": strategy_data.get("category", "unknown"),
-                                "risk_level": strategy_data.get("risk_level", "medium"),
-                                "supported_platforms": strategy_data.get("supported_platforms", []),
-                                "supported_instruments": strategy_data.get("supported_instruments", []),
-                                "default_params": strategy_data.get("default_params", {}),
-                                "param_schema": strategy_data.get("param_schema", {}),
-                                "risk_warnings": strategy_data.get("risk_warnings", []),
-                                "performance_metrics": strategy_data.get("performance_metrics", {}),
-                                "metadata": strategy_data.get("metadata", {})
-                            })
-                    except Exception as e:
-                        logger.log_error(f"Error loading strategy {file}: {e}")
+        # 缓存未命中时在线程中读取插件目录，避免阻塞事件循环
+        strategies, watched = await asyncio.to_thread(scan_strategy_plugin_files, STRATEGY_PLUGINS_DIR)
         
         # Fallback to plugin_loader if directory method fails
         if not strategies:
@@ -1541,11 +1985,14 @@ async def get_available_strategies():
                     "supported_platforms": plugin_info.get('supported_platforms', [])
                 })
 
-        return {"strategies": strategies}
+        result = {"strategies": strategies}
+        if watched:
+            store_profiles_scan("strategies", watched, result)
+        return result
     except Exception as e:
         logger.log_error(f"获取可用策略失败: {e}")
         add_missing_feature("available_strategies", "可用策略列表获取功能需要完善")
-        return {"strategies": []}
+        return {"success": False, "error": str(e), "strategies": []}
 
 @app.get("/api/strategies/{strategy_name}/templates")
 async def get_strategy_templates(strategy_name: str):
@@ -1569,7 +2016,7 @@ async def get_strategy_templates(strategy_name: str):
         return {"templates": template_list}
     except Exception as e:
         logger.log_error(f"获取策略模板失败: {e}")
-        return {"templates": []}
+        return {"success": False, "error": str(e), "templates": []}
 
 @app.get("/api/strategies/{strategy_name}/templates/{template_id}")
 async def get_strategy_template(strategy_name: str, template_id: str):
@@ -1617,32 +2064,19 @@ async def create_instance(request: CreateInstanceRequest):
         
         # 检查是否已存在相同的实例（同策略、同平台、同账号、同币种）
         try:
-            active_strategies = strategy_manager.get_active_strategies()
-            for strategy_instance in active_strategies:
-                if (hasattr(strategy_instance, 'account') and 
-                    hasattr(strategy_instance, 'platform') and 
-                    hasattr(strategy_instance, 'strategy_name') and
-                    hasattr(strategy_instance, 'parameters')):
-                    
-                    instance_account = getattr(strategy_instance, 'account', '')
-                    instance_platform = getattr(strategy_instance, 'platform', '')
-                    instance_strategy = getattr(strategy_instance, 'strategy_name', '')
-                    instance_symbol = getattr(strategy_instance, 'parameters', {}).get('symbol', '')
-                    
-                    # 标准化交易对格式进行比较
-                    request_symbol_normalized = request.symbol.replace('/', '').upper()
-                    instance_symbol_normalized = instance_symbol.replace('/', '').upper()
+            # 通过策略管理器的实例索引查找（交易对已标准化），只需再核对平台和运行状态
+            existing_instances = strategy_manager.find_strategy_instances(
+                request.account_id, request.strategy, request.symbol
+            )
+            for strategy_instance in existing_instances:
+                if (strategy_instance.strategy.status == StrategyStatus.RUNNING and
+                    str(strategy_instance.platform).upper() == request.platform.upper()):
                     
-                    if (instance_account == request.account_id and 
-                        instance_platform.upper() == request.platform.upper() and
-                        instance_strategy == request.strategy and
-                        instance_symbol_normalized == request_symbol_normalized):
-                        
-                        # 使用新的错误编码系统
-                        error_response = duplicate_instance_error(
-                            request.platform, request.account_id, request.strategy, request.symbol
-                        )
-                        raise HTTPException(status_code=400, detail=error_response)
+                    # 使用新的错误编码系统
+                    error_response = duplicate_instance_error(
+                        request.platform, request.account_id, request.strategy, request.symbol
+                    )
+                    raise HTTPException(status_code=400, detail=error_response)
         except HTTPException as http_exc:
             # 重新抛出HTTPException（比如重复实例检查）
             raise http_exc
@@ -1672,14 +2106,19 @@ async def create_instance(request: CreateInstanceRequest):
         # 不再自动启动策略实例，需要用户手动启动
         logger.log_info(f"✅ Created strategy instance: {request.account_id}/{instance_id} (manual start required)")
         
-        # 广播更新
-        await manager.broadcast({
-            "type": "instance_created",
+        # 广播消息与接口返回共用的实例信息
+        instance_info = {
+            "instance_id": instance_id,
             "account_id": request.account_id,
             "platform": request.platform,
             "strategy": request.strategy,
-            "instance_id": instance_id,
-            "started": False,  # 不再自动启动
+            "started": False  # 不再自动启动
+        }
+        
+        # 广播更新
+        await manager.broadcast({
+            "type": "instance_created",
+            **instance_info,
             "timestamp": datetime.now().isoformat()
         })
         
@@ -1688,11 +2127,7 @@ async def create_instance(request: CreateInstanceRequest):
         return {
             "success": True,
             "message": f"实例 {request.strategy} 创建成功，请在实例卡片中手动启动策略",
-            "instance_id": instance_id,
-            "account_id": request.account_id,
-            "platform": request.platform,
-            "strategy": request.strategy,
-            "started": False  # 不再自动启动
+            **instance_info
         }
         
     except HTTPException as http_exc:
@@ -1705,7 +2140,6 @@ async def create_instance(request: CreateInstanceRequest):
         raise HTTPException(status_code=400, detail=error_msg)
     except Exception as e:
         logger.log_error(f"❌ Create instance failed: {e}")
-        import traceback
         logger.log_error(f"Full traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"创建实例失败: {str(e)}")
 
@@ -1864,6 +2298,61 @@ async def force_stop_and_close_strategy(request: ForceStopStrategyRequest):
         add_missing_feature("strategy_force_stop", "紧急平仓功能需要完善")
         raise HTTPException(status_code=500, detail=str(e))
 
+@lru_cache(maxsize=256)
+def parse_csv_log_rows(csv_path: str, mtime_ns: int, limit: int) -> List[Dict[str, Any]]:
+    """解析交易CSV日志，返回最新的limit条记录（新的在前）
+    
+    mtime_ns作为缓存键的一部分，文件修改后自动重新解析
+    """
+    # 先只从文件末尾读取limit+1行：第一行可能是标题行或超出limit的旧记录，统一丢弃
+    tail = tail_lines(csv_path, limit + 1)
+    rows = _csv_rows_newest_first(csv.reader(tail[1:]), limit)
+    if len(rows) < limit and len(tail) > limit:
+        # 末尾有不完整的记录且文件更长，退回到读取整个文件
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            records = list(csv.reader(f))
+        rows = _csv_rows_newest_first(records[1:], limit)  # Skip header
+    return rows
+
+def _csv_rows_newest_first(records, limit: int) -> List[Dict[str, Any]]:
+    """将CSV记录转换为日志条目，新的在前，最多limit条"""
+    rows = []
+    for parts in reversed(list(records)):
+        if len(rows) >= limit:
+            break
+        if len(parts) >= 6:
+            timestamp, platform, symbol, action, direction = parts[:5]
+            rows.append({
+                "timestamp": timestamp,
+                "level": "INFO",
+                "message": f"{platform} {symbol} {action} {direction}",
+                "source": platform.lower()
+            })
+    return rows
+
+def collect_csv_log_rows(old_logs_dir, count: int, limit: int) -> List[Dict[str, Any]]:
+    """从各平台的交易CSV日志中收集最多count条记录（同步函数，供 asyncio.to_thread 调用）"""
+    logs = []
+    with os.scandir(old_logs_dir) as entries:
+        platform_entries = [entry for entry in entries if entry.is_dir()]
+    for platform_entry in platform_entries:
+        # Look for CSV log files
+        with os.scandir(platform_entry.path) as entries:
+            csv_entries = [entry for entry in entries
+                           if TRADE_LOG_NAME_RE.fullmatch(entry.name)]
+        csv_entries.sort(key=lambda entry: entry.name, reverse=True)
+        for csv_entry in csv_entries:
+            log_file = csv_entry.name
+            try:
+                # limit参与缓存键，与请求的limit保持一致以便复用解析结果
+                rows = parse_csv_log_rows(csv_entry.path, csv_entry.stat().st_mtime_ns, limit)
+                logs.extend(rows[:count - len(logs)])
+                if len(logs) >= count:
+                    return logs
+            except Exception as e:
+                logger.log_error(f"Error reading CSV log {log_file}: {e}")
+    return logs
+
 @app.get("/api/logs/recent")
 async def get_recent_logs(
     limit: int = Query(100, ge=1, le=1000),
@@ -1871,17 +2360,14 @@ async def get_recent_logs(
 ):
     """获取最近日志 - 基于真实日志文件"""
     try:
-        import os
-        import re
-        
         logs = []
         
         # Read from main runtime log - 使用正确的项目根目录路径
         runtime_log_path = project_root / "logs" / "runtime.log"
         if runtime_log_path.exists():
             try:
-                with open(runtime_log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()[-limit*2:]  # Read more to filter
+                lines = await asyncio.to_thread(tail_lines, runtime_log_path, limit * 2)  # Read more to filter
+                level_filter = level.upper() if level else None  # 只在循环外规范化一次
                     
                 for line in lines:
                     line = line.strip()
@@ -1889,25 +2375,22 @@ async def get_recent_logs(
                         continue
                         
                     # Parse log format: 2025-10-03 01:37:40 - INFO - [logger.py:info:73] - message
-                    # 尝试多种日志格式
-                    match = None
-                    
-                    # 格式1：完整格式 with file info
-                    match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?:,\d+)? - (\w+) - \[.*?\] - (.+)', line)
-                    if not match:
-                        # 格式2：简单格式 without file info
-                        match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?:,\d+)? - (\w+) - (.+)', line)
+                    # 非时间戳开头的行（如堆栈信息）直接跳过
+                    if not line[:4].isdigit():
+                        continue
+                    match = RUNTIME_LOG_LINE_RE.match(line)
                     
                     if match:
                         timestamp_str, log_level, message = match.groups()
+                        log_level = log_level.upper()
                         
                         # Filter by level if specified
-                        if level and log_level.upper() != level.upper():
+                        if level_filter and log_level != level_filter:
                             continue
                             
                         logs.append({
                             "timestamp": timestamp_str,
-                            "level": log_level.upper(),
+                            "level": log_level,
                             "message": message.strip(),
                             "source": "system"
                         })
@@ -1917,49 +2400,17 @@ async def get_recent_logs(
             except Exception as e:
                 logger.log_error(f"Error reading runtime log: {e}")
         
-        # Read from trading logs if available
-        old_logs_dir = "d:/Desktop/Stock-trading/old/logs"
+        # Read from trading logs if available（目录遍历和CSV解析在线程中进行）
+        old_logs_dir = OLD_LOGS_DIR
         if os.path.exists(old_logs_dir) and len(logs) < limit:
-            for platform_dir in os.listdir(old_logs_dir):
-                platform_path = os.path.join(old_logs_dir, platform_dir)
-                if os.path.isdir(platform_path):
-                    # Look for CSV log files
-                    for log_file in sorted(os.listdir(platform_path), reverse=True):
-                        if log_file.endswith('.csv') and log_file.startswith('log_'):
-                            try:
-                                csv_path = os.path.join(platform_path, log_file)
-                                with open(csv_path, 'r', encoding='utf-8') as f:
-                                    lines = f.readlines()
-                                    for line in reversed(lines[1:]):  # Skip header, read newest first
-                                        if len(logs) >= limit:
-                                            break
-                                        parts = line.strip().split(',')
-                                        if len(parts) >= 6:
-                                            timestamp = parts[0]
-                                            platform = parts[1]
-                                            symbol = parts[2]
-                                            action = parts[3]
-                                            direction = parts[4]
-                                            
-                                            logs.append({
-                                                "timestamp": timestamp,
-                                                "level": "INFO",
-                                                "message": f"{platform} {symbol} {action} {direction}",
-                                                "source": platform.lower()
-                                            })
-                                if len(logs) >= limit:
-                                    break
-                            except Exception as e:
-                                logger.log_error(f"Error reading CSV log {log_file}: {e}")
-                    if len(logs) >= limit:
-                        break
-        
-        # Sort by timestamp descending
-        logs.sort(key=lambda x: x['timestamp'], reverse=True)
+            logs.extend(await asyncio.to_thread(collect_csv_log_rows, old_logs_dir, limit - len(logs), limit))
+        
+        # Sort by timestamp descending（ISO时间戳按字符串比较即为时间顺序，取最新的limit条）
+        recent = heapq.nlargest(limit, logs, key=itemgetter('timestamp'))
         
         return {
-            "logs": logs[:limit],
-            "count": len(logs[:limit]),
+            "logs": recent,
+            "count": len(recent),
             "level_filter": level,
             "total_available": len(logs)
         }
@@ -1991,7 +2442,7 @@ async def websocket_logs(websocket: WebSocket):
             }
         }
         
-        await websocket.send_text(json.dumps(welcome_message, ensure_ascii=False))
+        await websocket.send_text(json_text(welcome_message))
         
         # 发送初始测试消息
         test_message = {
@@ -2004,11 +2455,11 @@ async def websocket_logs(websocket: WebSocket):
                 "category": "connection"
             }
         }
-        await websocket.send_text(json.dumps(test_message, ensure_ascii=False))
+        await websocket.send_text(json_text(test_message))
         
         # 保持连接活跃 - 改进的心跳机制
         heartbeat_interval = 60  # 增加到60秒
-        last_cleanup = datetime.now()
+        # 过期连接由启动时的 periodic_cleanup_task 统一清理，这里不再按连接各自清理
         
         while True:
             try:
@@ -2016,17 +2467,18 @@ async def websocket_logs(websocket: WebSocket):
                 data = await asyncio.wait_for(websocket.receive_text(), timeout=heartbeat_interval)
                 
                 try:
-                    message = json.loads(data)
+                    message = orjson.loads(data)
                     message_type = message.get("type", "unknown")
                     
                     if message_type == "ping":
                         # 响应心跳
+                        now_iso = datetime.now().isoformat()
                         pong_response = {
                             "type": "pong",
-                            "timestamp": datetime.now().isoformat(),
-                            "server_time": datetime.now().isoformat()
+                            "timestamp": now_iso,
+                            "server_time": now_iso
                         }
-                        await websocket.send_text(json.dumps(pong_response, ensure_ascii=False))
+                        await websocket.send_text(json_text(pong_response))
                         
                     elif message_type == "request_logs":
                         # 客户端请求最近日志
@@ -2037,7 +2489,7 @@ async def websocket_logs(websocket: WebSocket):
                     if conn_id in manager.connection_metadata:
                         manager.connection_metadata[conn_id]["last_heartbeat"] = datetime.now()
                         
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"收到无效JSON消息: {data}")
                     
             except asyncio.TimeoutError:
@@ -2050,22 +2502,15 @@ async def websocket_logs(websocket: WebSocket):
                 }
                 
                 try:
-                    await websocket.send_text(json.dumps(heartbeat_message, ensure_ascii=False))
+                    await websocket.send_text(json_text(heartbeat_message))
                 except Exception as e:
                     logger.warning(f"发送心跳失败，连接可能已断开: {e}")
                     break
-                    
-            # 定期清理过期连接
-            current_time = datetime.now()
-            if (current_time - last_cleanup).total_seconds() > 300:  # 每5分钟清理一次
-                await manager.cleanup_stale_connections()
-                last_cleanup = current_time
                 
     except WebSocketDisconnect:
         logger.info(f"日志WebSocket客户端主动断开: {client_ip}")
     except Exception as e:
         logger.error(f"日志WebSocket连接错误 ({client_ip}): {e}")
-        import traceback
         logger.debug(f"WebSocket错误详情: {traceback.format_exc()}")
     finally:
         manager.disconnect(websocket)
@@ -2076,38 +2521,37 @@ async def send_recent_logs(websocket: WebSocket, count: int = 20):
     try:
         log_file = project_root / "logs" / "runtime.log"
         if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                recent_logs = lines[-count:] if len(lines) > count else lines
-                
+            recent_logs = await asyncio.to_thread(tail_lines, log_file, count)
+            
+            # 历史日志合并为一条log_batch消息发送，最后附带加载完成提示
+            now_iso = datetime.now().isoformat()
+            entries = []
             for i, line in enumerate(recent_logs):
                 if line.strip():
-                    log_message = {
-                        "type": "log",
-                        "data": {
-                            "timestamp": datetime.now().isoformat(),
-                            "level": "INFO",
-                            "message": line.strip(),
-                            "source": "history",
-                            "category": "system",
-                            "index": i + 1,
-                            "total": len(recent_logs)
-                        }
-                    }
-                    await websocket.send_text(json.dumps(log_message, ensure_ascii=False))
-                    
-            # 发送历史日志完成消息
-            complete_message = {
-                "type": "log",
-                "data": {
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "INFO",
-                    "message": f"📜 历史日志加载完成 (共 {len(recent_logs)} 条)",
-                    "source": "websocket_system",
-                    "category": "system"
-                }
+                    entries.append({
+                        "timestamp": now_iso,
+                        "level": "INFO",
+                        "message": line.strip(),
+                        "source": "history",
+                        "category": "system",
+                        "index": i + 1,
+                        "total": len(recent_logs)
+                    })
+            entries.append({
+                "timestamp": now_iso,
+                "level": "INFO",
+                "message": f"📜 历史日志加载完成 (共 {len(recent_logs)} 条)",
+                "source": "websocket_system",
+                "category": "system"
+            })
+            
+            batch_message = {
+                "type": "log_batch",
+                "data": entries,
+                "total": len(recent_logs),
+                "complete": True
             }
-            await websocket.send_text(json.dumps(complete_message, ensure_ascii=False))
+            await websocket.send_text(json_text(batch_message))
             
     except Exception as e:
         logger.error(f"发送历史日志失败: {e}")
@@ -2121,7 +2565,7 @@ async def send_recent_logs(websocket: WebSocket, count: int = 20):
                 "category": "error"
             }
         }
-        await websocket.send_text(json.dumps(error_message, ensure_ascii=False))
+        await websocket.send_text(json_text(error_message))
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -2132,17 +2576,8 @@ async def websocket_endpoint(websocket: WebSocket):
             # 定期发送系统状态更新
             await asyncio.sleep(5)
             
-            # 发送实时数据
-            update_data = {
-                "type": "status_update",
-                "data": {
-                    "timestamp": datetime.now().isoformat(),
-                    "active_connections": len(manager.active_connections)
-                },
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            await websocket.send_text(json.dumps(update_data))
+            # 发送实时数据（所有连接共用同一份已编码的状态消息）
+            await websocket.send_text(manager.get_status_update_text())
             
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -2212,12 +2647,13 @@ async def cleanup_websocket_connections():
         }
 async def get_websocket_log_status():
     """获取WebSocket日志连接状态"""
+    log_count = len(manager.log_connections)
     return {
-        "active_connections": len(manager.log_connections),
+        "active_connections": log_count,
         "total_connections": len(manager.active_connections),
-        "status": "connected" if len(manager.log_connections) > 0 else "disconnected",
+        "status": "connected" if log_count > 0 else "disconnected",
         "endpoint": "ws://localhost:8001/ws/logs",
-        "message": "WebSocket日志系统状态正常" if len(manager.log_connections) > 0 else "没有活跃的WebSocket日志连接"
+        "message": "WebSocket日志系统状态正常" if log_count > 0 else "没有活跃的WebSocket日志连接"
     }
 
 @app.post("/api/logs/websocket/test")
@@ -2232,15 +2668,18 @@ async def test_websocket_logs():
             "📈 WebSocket日志测试 - 交易级别"
         ]
         
-        for i, msg in enumerate(test_messages):
-            await manager.broadcast_log({
-                "timestamp": datetime.now().isoformat(),
-                "level": ["info", "warning", "error", "trade"][i],
+        now_iso = datetime.now().isoformat()
+        await manager.broadcast_log_batch([
+            {
+                "timestamp": now_iso,
+                "level": level,
                 "message": msg,
                 "source": "websocket_test",
                 "category": "test",
                 "test_sequence": i + 1
-            })
+            }
+            for i, (level, msg) in enumerate(zip(["info", "warning", "error", "trade"], test_messages))
+        ])
         
         return {
             "success": True,
@@ -2294,44 +2733,67 @@ async def test_webhook_notification():
 
 # ==================== 配置文件管理接口 ====================
 
+def scan_config_profiles(profiles_dir: Path) -> Dict[str, Any]:
+    """扫描profiles目录下的策略配置文件（同步函数，供 asyncio.to_thread 调用），结果写入扫描缓存"""
+    profiles = {}
+    watched = {}
+    
+    # 记录目录及配置文件的mtime，均未变化时list_config_profiles直接复用结果
+    # scandir 的 DirEntry 自带类型信息，stat() 每个条目只调用一次
+    if profiles_dir.exists():
+        watched[profiles_dir] = profiles_dir.stat().st_mtime_ns
+        with os.scandir(profiles_dir) as platform_entries:
+            for platform_entry in platform_entries:
+                if not platform_entry.is_dir() or platform_entry.name.startswith('_'):
+                    continue
+                platform_profiles = profiles[platform_entry.name] = {}
+                watched[platform_entry.path] = platform_entry.stat().st_mtime_ns
+                
+                with os.scandir(platform_entry.path) as account_entries:
+                    for account_entry in account_entries:
+                        if not account_entry.is_dir():
+                            continue
+                        account_profiles = platform_profiles[account_entry.name] = {}
+                        watched[account_entry.path] = account_entry.stat().st_mtime_ns
+                        
+                        # 列出该账户下的所有策略配置
+                        with os.scandir(account_entry.path) as config_entries:
+                            for config_entry in config_entries:
+                                name = config_entry.name
+                                if not name.endswith('.json') or name == "profile.json" or not config_entry.is_file():
+                                    continue
+                                file_stat = config_entry.stat()
+                                watched[config_entry.path] = file_stat.st_mtime_ns
+                                account_profiles[name[:-5]] = {
+                                    "file_path": config_entry.path,
+                                    "last_modified": file_stat.st_mtime,
+                                    "size": file_stat.st_size
+                                }
+    
+    result = {
+        "success": True,
+        "data": {
+            "profiles": profiles,
+            "total_platforms": len(profiles),
+            "total_accounts": sum(len(accounts) for accounts in profiles.values())
+        }
+    }
+    if watched:
+        store_profiles_scan("config_profiles", watched, result)
+    return result
+
 @app.get("/api/config/profiles")
 @handle_api_errors
 async def list_config_profiles():
     """列出所有配置文件"""
     try:
-        profiles = {}
-        
-        # 扫描profiles目录
-        profiles_dir = project_root / "profiles"
-        if profiles_dir.exists():
-            for platform_dir in profiles_dir.iterdir():
-                if platform_dir.is_dir() and not platform_dir.name.startswith('_'):
-                    platform_name = platform_dir.name
-                    profiles[platform_name] = {}
-                    
-                    for account_dir in platform_dir.iterdir():
-                        if account_dir.is_dir():
-                            account_name = account_dir.name
-                            profiles[platform_name][account_name] = {}
-                            
-                            # 列出该账户下的所有策略配置
-                            for config_file in account_dir.glob("*.json"):
-                                if config_file.name != "profile.json":
-                                    strategy_name = config_file.stem
-                                    profiles[platform_name][account_name][strategy_name] = {
-                                        "file_path": str(config_file),
-                                        "last_modified": config_file.stat().st_mtime,
-                                        "size": config_file.stat().st_size
-                                    }
+        result = get_cached_profiles_scan("config_profiles")
+        if result is None:
+            # 缓存未命中时才在线程中扫描，避免目录遍历阻塞事件循环
+            result = await asyncio.to_thread(scan_config_profiles, PROFILES_DIR)
         
-        return {
-            "success": True,
-            "data": {
-                "profiles": profiles,
-                "total_platforms": len(profiles),
-                "total_accounts": sum(len(accounts) for accounts in profiles.values())
-            }
-        }
+        # 直接返回ORJSONResponse，跳过FastAPI对返回值的jsonable_encoder遍历
+        return ORJSONResponse(result)
         
     except Exception as e:
         logger.log_error(f"列出配置文件失败: {e}")
@@ -2342,31 +2804,40 @@ async def list_config_profiles():
 
 @app.get("/api/config/profiles/{platform}/{account}/{strategy}")
 @handle_api_errors
-async def get_config_profile(platform: str, account: str, strategy: str):
-    """获取特定的配置文件内容"""
+async def get_config_profile(
+    platform: str,
+    account: str,
+    strategy: str,
+    if_none_match: Optional[str] = Header(None)
+):
+    """获取特定的配置文件内容（支持ETag，文件未变化时返回304）"""
     try:
-        config_file = project_root / "profiles" / platform / account / f"{strategy}.json"
+        config_file = PROFILES_DIR / platform / account / f"{strategy}.json"
         
-        if not config_file.exists():
+        try:
+            file_stat = config_file.stat()
+            etag = file_etag(file_stat)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            config_data = await asyncio.to_thread(read_json_file, config_file)
+        except FileNotFoundError:
             return {
                 "success": False,
                 "error": f"配置文件不存在: {config_file}"
             }
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-        
-        return {
+        # 直接返回ORJSONResponse，跳过FastAPI对返回值的jsonable_encoder遍历
+        return ORJSONResponse({
             "success": True,
             "data": {
                 "config": config_data,
                 "file_info": {
                     "path": str(config_file),
-                    "last_modified": config_file.stat().st_mtime,
-                    "size": config_file.stat().st_size
+                    "last_modified": file_stat.st_mtime,
+                    "size": file_stat.st_size
                 }
             }
-        }
+        }, headers={"ETag": etag})
         
     except Exception as e:
         logger.log_error(f"获取配置文件失败: {e}")
@@ -2380,23 +2851,24 @@ async def get_config_profile(platform: str, account: str, strategy: str):
 async def save_config_profile(platform: str, account: str, strategy: str, config_data: dict):
     """保存配置文件"""
     try:
-        config_dir = project_root / "profiles" / platform / account
-        config_dir.mkdir(parents=True, exist_ok=True)
+        config_dir = PROFILES_DIR / platform / account
+        await asyncio.to_thread(ensure_dir, config_dir)
         
         config_file = config_dir / f"{strategy}.json"
         
-        # 备份现有文件
-        if config_file.exists():
-            backup_file = config_file.with_suffix(f".json.backup.{int(time.time())}")
-            shutil.copy2(config_file, backup_file)
+        # 备份现有文件（在线程中复制，避免阻塞事件循环）
+        backup_file = config_file.with_suffix(f".json.backup.{backup_suffix()}")
+        try:
+            await asyncio.to_thread(shutil.copy2, config_file, backup_file)
             logger.log_info(f"已备份配置文件到: {backup_file}")
+        except FileNotFoundError:
+            pass
         
         # 验证配置数据
         validated_config = validate_config_data(config_data, strategy)
         
-        # 保存新配置
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(validated_config, f, indent=2, ensure_ascii=False)
+        # 保存新配置（原子写入）
+        await asyncio.to_thread(write_json_file, config_file, validated_config)
         
         logger.log_info(f"配置文件已保存: {config_file}")
         
@@ -2435,7 +2907,7 @@ async def save_config_profile(platform: str, account: str, strategy: str, config
 async def delete_config_profile(platform: str, account: str, strategy: str):
     """删除配置文件"""
     try:
-        config_file = project_root / "profiles" / platform / account / f"{strategy}.json"
+        config_file = PROFILES_DIR / platform / account / f"{strategy}.json"
         
         if not config_file.exists():
             return {
@@ -2444,7 +2916,7 @@ async def delete_config_profile(platform: str, account: str, strategy: str):
             }
         
         # 创建备份
-        backup_file = config_file.with_suffix(f".json.deleted.{int(time.time())}")
+        backup_file = config_file.with_suffix(f".json.deleted.{backup_suffix()}")
         shutil.move(config_file, backup_file)
         
         logger.log_info(f"配置文件已删除，备份到: {backup_file}")
@@ -2464,71 +2936,144 @@ async def delete_config_profile(platform: str, account: str, strategy: str):
             "error": str(e)
         }
 
+# 配置字段默认值
+CONFIG_FIELD_DEFAULTS = {
+    "symbol": "OP/USDT",
+    "base_amount": 10.0,
+    "price_step": 0.01,
+    "max_orders": 20,
+    "hedge_enabled": True
+}
+
+# 各策略的必填字段
+STRATEGY_REQUIRED_FIELDS = {
+    "martingale_hedge": ("symbol", "base_amount", "price_step")
+}
+
+# 需要转换为浮点数的字段
+FLOAT_CONFIG_FIELDS = ("base_amount", "price_step")
+
+@lru_cache(maxsize=None)
+def get_config_field_specs(strategy: str) -> tuple:
+    """返回策略的字段校验规则：(必填字段及默认值, 浮点字段及默认值)，每个策略只生成一次"""
+    required = tuple((field, CONFIG_FIELD_DEFAULTS.get(field)) for field in STRATEGY_REQUIRED_FIELDS.get(strategy, ()))
+    floats = tuple((field, CONFIG_FIELD_DEFAULTS[field]) for field in FLOAT_CONFIG_FIELDS)
+    return required, floats
+
 def validate_config_data(config_data: dict, strategy: str) -> dict:
     """验证配置数据的有效性"""
-    validated = config_data.copy()
-    
     # 基本验证
-    if not isinstance(validated, dict):
+    if not isinstance(config_data, dict):
         raise ValueError("配置数据必须是字典格式")
     
-    # 策略特定验证
-    if strategy == "martingale_hedge":
-        required_fields = ["symbol", "base_amount", "price_step"]
-        for field in required_fields:
-            if field not in validated:
-                validated[field] = get_default_value(field)
+    required_fields, float_fields = get_config_field_specs(strategy)
     
-    # 数据类型验证
-    if "base_amount" in validated:
-        try:
-            validated["base_amount"] = float(validated["base_amount"])
-        except (ValueError, TypeError):
-            validated["base_amount"] = 10.0
+    # 写时复制：只有第一次需要修改时才复制输入，配置无需修改时直接返回原数据
+    validated = config_data
     
-    if "price_step" in validated:
-        try:
-            validated["price_step"] = float(validated["price_step"])
-        except (ValueError, TypeError):
-            validated["price_step"] = 0.01
+    # 策略特定验证
+    for field, default in required_fields:
+        if field not in validated:
+            if validated is config_data:
+                validated = dict(config_data)
+            validated[field] = default
+    
+    # 数据类型验证（已是浮点数的字段无需转换）
+    for field, default in float_fields:
+        if field in validated and not isinstance(validated[field], float):
+            try:
+                value = float(validated[field])
+            except (ValueError, TypeError):
+                value = default
+            if validated is config_data:
+                validated = dict(config_data)
+            validated[field] = value
     
     return validated
 
 def get_default_value(field: str):
     """获取字段的默认值"""
-    defaults = {
-        "symbol": "OP/USDT",
-        "base_amount": 10.0,
-        "price_step": 0.01,
-        "max_orders": 20,
-        "hedge_enabled": True
-    }
-    return defaults.get(field, None)
+    return CONFIG_FIELD_DEFAULTS.get(field)
 
 # ==================== 日志文件读取接口 ====================
 
+def detect_text_encoding(head: bytes) -> str:
+    """根据文件开头的字节判断编码：BOM或合法UTF-8按UTF-8处理，否则按GBK处理"""
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # 增量解码允许开头片段末尾的多字节字符被截断
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'gbk'
+
+def read_log_file_entries(log_file: Path, tail: int = 1000) -> List[Dict[str, Any]]:
+    """读取日志文件末尾tail行并转换为日志条目（同步函数，供 asyncio.to_thread 调用）"""
+    logs = []
+    
+    # 逐行流式读取，只保留末尾tail行及其行号，内存占用与tail成正比而不是整个文件
+    with open(log_file, 'rb') as f:
+        # 只检测开头4KB确定编码，不再在UTF-8解码失败后重新读取整个文件
+        encoding = detect_text_encoding(f.read(4096))
+        f.seek(0)
+        recent = deque(enumerate(f), maxlen=tail)
+    
+    if log_file.suffix == '.csv':
+        # CSV格式日志（csv.reader 正确处理带引号的逗号）
+        # 原始行可由parts还原，不再随每条记录重复返回
+        line_numbers = [i for i, _ in recent if i > 0]  # 跳过标题行
+        lines = [raw.decode(encoding, errors='replace').strip() for i, raw in recent if i > 0]
+        for i, parts in zip(line_numbers, csv.reader(lines)):
+            if len(parts) >= 4:
+                logs.append({
+                    "timestamp": parts[0],
+                    "level": "trade",
+                    "message": f"交易记录 #{i}: {parts[3]}",
+                    "source": "TradingLog",
+                    "data": {
+                        "parts": parts
+                    }
+                })
+    else:
+        # 文本格式日志：优先使用行首时间戳，没有时统一使用读取时间
+        now_iso = datetime.now().isoformat()
+        for i, raw in recent:
+            line = raw.decode(encoding, errors='replace').strip()
+            if line:
+                timestamp_match = LOG_TIMESTAMP_PREFIX_RE.match(line) if line[:4].isdigit() else None
+                logs.append({
+                    "timestamp": timestamp_match.group() if timestamp_match else now_iso,
+                    "level": "info",
+                    "message": line,
+                    "source": "LogFile",
+                    "line": i + 1
+                })
+    
+    return logs
+
 @app.get("/api/logs/file")
 @handle_api_errors
-async def get_log_file(path: str = Query(..., description="日志文件路径")):
-    """读取本地日志文件"""
+async def get_log_file(
+    path: str = Query(..., description="日志文件路径"),
+    tail: int = Query(1000, ge=1, le=100000, description="只返回末尾的行数"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """读取本地日志文件（支持ETag，文件未变化时返回304）"""
     try:
         # 安全检查，防止路径遍历攻击
-        if '..' in path or path.startswith('/'):
+        if not LOG_FILE_PATH_RE.fullmatch(path) or '..' in path or path.startswith('/'):
             return {
                 "success": False,
                 "error": "非法的文件路径"
             }
         
-        # 支持的日志文件路径
-        allowed_paths = [
-            project_root / "logs",
-            Path("d:/Desktop/Stock-trading/old/logs")
-        ]
-        
         log_file = None
-        for allowed_path in allowed_paths:
-            candidate = allowed_path / path
-            if candidate.exists() and candidate.is_file():
+        for allowed_path in LOG_FILE_DIRS:
+            # 解析符号链接后仍须位于允许的目录内
+            allowed_root = allowed_path.resolve()
+            candidate = (allowed_root / path).resolve()
+            if candidate.is_relative_to(allowed_root) and candidate.is_file():
                 log_file = candidate
                 break
         
@@ -2538,63 +3083,27 @@ async def get_log_file(path: str = Query(..., description="日志文件路径"))
                 "error": f"日志文件不存在: {path}"
             }
         
-        # 读取文件内容
-        logs = []
-        try:
-            if log_file.suffix == '.csv':
-                # CSV格式日志
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for i, line in enumerate(lines[1:], 1):  # 跳过标题行
-                        parts = line.strip().split(',')
-                        if len(parts) >= 4:
-                            logs.append({
-                                "timestamp": parts[0] if len(parts) > 0 else "",
-                                "level": "trade",
-                                "message": f"交易记录 #{i}: {parts[3] if len(parts) > 3 else ''}",
-                                "source": "TradingLog",
-                                "data": {
-                                    "raw_line": line.strip(),
-                                    "parts": parts
-                                }
-                            })
-            else:
-                # 文本格式日志
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for i, line in enumerate(lines):
-                        if line.strip():
-                            logs.append({
-                                "timestamp": datetime.now().isoformat(),
-                                "level": "info",
-                                "message": line.strip(),
-                                "source": "LogFile",
-                                "line": i + 1
-                            })
-        
-        except UnicodeDecodeError:
-            # 尝试其他编码
-            with open(log_file, 'r', encoding='gbk') as f:
-                content = f.read()
-                logs.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "info", 
-                    "message": f"日志文件内容 (GBK编码): {content[:1000]}...",
-                    "source": "LogFile"
-                })
+        file_stat = log_file.stat()
+        etag = file_etag(file_stat)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
         
-        return {
+        # 读取文件内容（在线程中读取，避免大文件阻塞事件循环）
+        logs = await asyncio.to_thread(read_log_file_entries, log_file, tail)
+        
+        # 日志条目较多时jsonable_encoder开销明显，直接返回ORJSONResponse
+        return ORJSONResponse({
             "success": True,
             "data": {
                 "logs": logs,
                 "total": len(logs),
                 "file_info": {
                     "path": str(log_file),
-                    "size": log_file.stat().st_size,
-                    "last_modified": log_file.stat().st_mtime
+                    "size": file_stat.st_size,
+                    "last_modified": file_stat.st_mtime
                 }
             }
-        }
+        }, headers={"ETag": etag})
         
     except Exception as e:
         logger.log_error(f"读取日志文件失败: {e}")
@@ -2605,4 +3114,5 @@ async def get_log_file(path: str = Query(..., description="日志文件路径"))
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8001)
\ No newline at end of file
+    # 关闭permessage-deflate：广播消息已只序列化一次，避免再为每个连接单独压缩同一帧
+    uvicorn.run(app, host="127.0.0.1", port=8001, ws_per_message_deflate=False)
\ No newline at end of file
@@ -56,6 +56,9 @@ export function LogsPanel() {
           if (message.type === 'log' && message.data) {
             console.log('📝 添加新日志:', message.data);
             setLogs(prev => [...prev, message.data].slice(-1000)); // 保留最新1000条
+          } else if (message.type === 'log_batch' && Array.isArray(message.data)) {
+            // 批量日志消息（历史日志、测试日志等）
+            setLogs(prev => [...prev, ...message.data].slice(-1000));
           }
         } catch (error) {
           console.error('❌ 解析日志消息失败:', error);
@@ -182,7 +182,7 @@ export function SystemTest() {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          if (data.type === 'log') {
+          if (data.type === 'log' || data.type === 'log_batch') {
             updateTestResult('WebSocket日志连接', { 
               status: 'success', 
               message: '✅ 收到日志消息，连接正常',
@@ -79,6 +79,9 @@ export function WebSocketDiagnostic() {
               // 保持最近100条日志
               return newLogs.slice(-100);
             });
+          } else if (data.type === 'log_batch' && Array.isArray(data.data)) {
+            // 批量日志消息（历史日志、测试日志等）
+            setLogs(prev => [...prev, ...data.data].slice(-100));
           } else if (data.type === 'connection') {
             setLogs(prev => [...prev, {
               timestamp: data.timestamp || new Date().toISOString(),
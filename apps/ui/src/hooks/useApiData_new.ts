@@ -251,24 +251,32 @@ export function useApiData(): UseApiDataReturn {
       try {
         const message = JSON.parse(event.data);
         
+        // 单条日志（log）与批量日志（log_batch，如历史日志）统一按条处理
+        let logEntries: any[] = [];
         if (message.type === 'log' && message.data) {
-          const logEntry = message.data;
+          logEntries = [message.data];
+        } else if (message.type === 'log_batch' && Array.isArray(message.data)) {
+          logEntries = message.data;
+        }
+        
+        if (logEntries.length > 0) {
+          // 检查是否包含实例状态更新日志
+          const hasStatusUpdate = logEntries.some(logEntry =>
+            logEntry.category === 'strategy_status' || 
+            logEntry.message?.includes('策略') ||
+            logEntry.message?.includes('实例'));
           
-          // 检查是否是实例状态更新日志
-          if (logEntry.category === 'strategy_status' || 
-              logEntry.message.includes('策略') ||
-              logEntry.message.includes('实例')) {
-            
+          if (hasStatusUpdate) {
             // 延迟刷新，避免过于频繁的更新
             setTimeout(() => {
               fetchRunningInstances();
             }, 1000);
           }
           
-          // 更新日志列表
+          // 更新日志列表（最新的在前）
           setState(prev => ({
             ...prev,
-            recentLogs: [logEntry, ...prev.recentLogs.slice(0, 99)] // 保持最新100条
+            recentLogs: [...logEntries.slice().reverse(), ...prev.recentLogs].slice(0, 100) // 保持最新100条
           }));
         }
         
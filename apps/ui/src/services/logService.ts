@@ -39,6 +39,9 @@ class LogService {
           const logData = JSON.parse(event.data);
           if (logData.type === 'log') {
             this.addLog(logData.data);
+          } else if (logData.type === 'log_batch' && Array.isArray(logData.data)) {
+            // 批量日志消息（历史日志、测试日志等），按顺序逐条加入
+            logData.data.forEach((entry: LogEntry) => this.addLog(entry));
           }
         } catch (error) {
           console.error('解析日志WebSocket消息失败:', error);
@@ -112,7 +112,7 @@ export interface ConfigProfilesResponse {
 
 // WebSocket消息类型
 export interface WebSocketMessage {
-  type: 'log' | 'instance_update' | 'system_status' | 'heartbeat';
+  type: 'log' | 'log_batch' | 'instance_update' | 'system_status' | 'heartbeat';
   data?: any;
   timestamp: string;
 }
@@ -245,6 +245,7 @@ export const LOG_LEVELS = {
 
 export const WEBSOCKET_MESSAGE_TYPES = {
   LOG: 'log',
+  LOG_BATCH: 'log_batch',
   INSTANCE_UPDATE: 'instance_update',
   SYSTEM_STATUS: 'system_status',
   HEARTBEAT: 'heartbeat'
@@ -4,13 +4,28 @@
 """
 import json
 import os
-from typing import Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List
 from pathlib import Path
 
 from core.logger import get_logger
 
+# 优先使用orjson解析（比标准库快数倍），未安装时回退到json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# 模板占位符（如 your_api_key_here / demo_secret），忽略大小写一次匹配
+_TEMPLATE_VALUE_RE = re.compile(r'your_|demo_', re.IGNORECASE)
+
+# 不可能是账户目录的条目，按名称直接跳过（隐藏目录另按 '.' 前缀跳过）
+_EXCLUDED_DIR_NAMES = frozenset({'__pycache__'})
+
 
 class AccountManager:
     """账户配置管理器"""
@@ -19,6 +34,35 @@ class AccountManager:
         self.accounts_dir = Path(accounts_dir)
         if not self.accounts_dir.exists():
             raise FileNotFoundError(f"Accounts directory not found: {accounts_dir}")
+        # 热路径用字符串拼接路径（os.path.join），避免每次调用都创建Path对象
+        self._accounts_dir_str = os.fspath(self.accounts_dir)
+        
+        # JSON文件内容缓存：{file_path: ((mtime_ns, size), 原始字节)}，文件未修改时不重新读取
+        # 缓存的是字节而非dict，每次都用orjson重新解析得到全新对象，调用方可以放心修改返回值
+        self._json_cache: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+        # 已通过验证的配置：{account_name: 缓存中的原始字节}，文件未修改时不重复验证
+        self._validated_configs: Dict[str, bytes] = {}
+        # 账户列表缓存：((目录路径, mtime_ns), ...), 账户列表)
+        # 账户目录增删改变根目录mtime，配置文件增删改变所在账户目录mtime，均未变化时复用上次结果
+        self._accounts_cache: Optional[Tuple[Tuple[Tuple[str, int], ...], List[str]]] = None
+    
+    def _read_json_bytes(self, path: Path) -> bytes:
+        """读取JSON文件的原始字节，文件未变化时直接返回缓存的字节"""
+        file_path = os.fspath(path)
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        # 整个文件一次读完，无缓冲模式直接使用FileIO，省去BufferedReader的创建
+        with open(file_path, 'rb', buffering=0) as f:
+            raw = f.read()
+        # 兼容带BOM的旧文件（orjson不接受BOM）
+        if raw[:3] == b'\xef\xbb\xbf':
+            raw = raw[3:]
+        self._json_cache[file_path] = (signature, raw)
+        return raw
     
     def load_account_config(self, account_name: str) -> Dict[str, Any]:
         """
@@ -34,18 +78,18 @@ class AccountManager:
             FileNotFoundError: 配置文件不存在
             ValueError: 配置格式错误或缺少必要字段
         """
-        account_dir = self.accounts_dir / account_name
-        config_file = account_dir / "binance_api.json"
-        
-        if not config_file.exists():
-            raise FileNotFoundError(f"Account config not found: {config_file}")
+        config_file = os.path.join(self._accounts_dir_str, account_name, "binance_api.json")
         
         try:
-            with open(config_file, 'r', encoding='utf-8-sig') as f:
-                config = json.load(f)
+            # 直接读取，文件是否存在由读取时的stat判断，不再单独exists检查
+            raw = self._read_json_bytes(config_file)
+            # 每次重新解析缓存的字节，返回的是全新对象，调用方修改不会影响缓存
+            config = _json_loads(raw)
             
-            # 验证必要字段
-            self._validate_config(config, account_name)
+            # 验证必要字段（文件重新读取后才需要再次验证）
+            if self._validated_configs.get(account_name) is not raw:
+                self._validate_config(config, account_name)
+                self._validated_configs[account_name] = raw
             
             # 添加账户名称到配置中
             config['account_name'] = account_name
@@ -53,6 +97,8 @@ class AccountManager:
             logger.info(f"Loaded account config: {account_name}")
             return config
             
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Account config not found: {config_file}") from None
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file {config_file}: {e}")
         except Exception as e:
@@ -68,7 +114,7 @@ class AccountManager:
                 raise ValueError(f"Missing required field '{field}' in account {account_name}")
             
             # 检查是否为模板占位符
-            if 'your_' in config[field].lower() or 'demo_' in config[field].lower():
+            if _TEMPLATE_VALUE_RE.search(config[field]):
                 raise ValueError(f"Please replace template value for '{field}' in account {account_name}")
         
         # 验证设置部分
@@ -91,16 +137,70 @@ class AccountManager:
             raise ValueError(f"Unsupported API type: {settings['api_type']}")
     
     def list_accounts(self) -> list[str]:
-        """列出所有可用的账户"""
+        """列出所有可用的账户（目录未变化时复用上次的扫描结果）"""
+        cached = self._accounts_cache
+        if cached is not None:
+            try:
+                if all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in cached[0]):
+                    return list(cached[1])
+            except OSError:
+                pass
+        
         accounts = []
+        # 先记录目录mtime再读取目录内容，扫描期间的改动会使缓存在下次调用时失效
+        watched = [(self._accounts_dir_str, os.stat(self._accounts_dir_str).st_mtime_ns)]
+        
+        # 单次scandir遍历，DirEntry自带条目类型，判断目录无需额外stat
+        with os.scandir(self._accounts_dir_str) as entries:
+            for entry in entries:
+                # 先按名称过滤（名称随目录读取返回，不需要系统调用），再检查配置文件
+                name = entry.name
+                if name.startswith('.') or name in _EXCLUDED_DIR_NAMES:
+                    continue
+                if entry.is_dir():
+                    watched.append((entry.path, entry.stat().st_mtime_ns))
+                    if os.path.exists(os.path.join(entry.path, "binance_api.json")):
+                        accounts.append(name)
+        
+        accounts.sort()
+        self._accounts_cache = (tuple(watched), accounts)
+        return list(accounts)
+    
+    def load_account_configs(self, account_names: Optional[List[str]] = None,
+                             errors: Optional[Dict[str, Exception]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        批量加载多个账户的配置信息，各账户的配置文件在线程池中并发读取
         
-        for account_dir in self.accounts_dir.iterdir():
-            if account_dir.is_dir():
-                config_file = account_dir / "binance_api.json"
-                if config_file.exists():
-                    accounts.append(account_dir.name)
+        Args:
+            account_names: 账户名称列表，默认为全部可用账户
+            errors: 可选，传入时记录加载失败账户的异常 {账户名称: 异常}
+            
+        Returns:
+            {账户名称: 配置字典}，加载失败的账户记录错误日志后跳过
+        """
+        if account_names is None:
+            account_names = self.list_accounts()
+        if not account_names:
+            return {}
         
-        return sorted(accounts)
+        def load(account_name: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.load_account_config(account_name)
+            except Exception as e:
+                logger.warning(f"Skipping account {account_name}: {e}")
+                if errors is not None:
+                    errors[account_name] = e
+                return None
+        
+        # 文件读取期间释放GIL，多个账户的磁盘I/O可以重叠进行
+        max_workers = min(32, len(account_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(load, account_names)
+            return {
+                account_name: config
+                for account_name, config in zip(account_names, results)
+                if config is not None
+            }
     
     def get_api_credentials(self, account_name: str) -> Dict[str, str]:
         """
@@ -159,13 +259,14 @@ if __name__ == "__main__":
         accounts = manager.list_accounts()
         print(f"Available accounts: {accounts}")
         
+        # 各账户配置在线程池中并发加载（同时填充文件缓存，is_testnet 不再读盘），按账户顺序输出结果及错误
+        errors: Dict[str, Exception] = {}
+        manager.load_account_configs(accounts, errors)
         for account in accounts:
-            try:
-                config = manager.load_account_config(account)
-                testnet = manager.is_testnet(account)
-                print(f"Account {account}: testnet={testnet}")
-            except Exception as e:
-                print(f"Error loading {account}: {e}")
+            if account in errors:
+                print(f"Error loading {account}: {errors[account]}")
+                continue
+            print(f"Account {account}: testnet={manager.is_testnet(account)}")
                 
     except Exception as e:
         print(f"Failed to initialize AccountManager: {e}")
\ No newline at end of file
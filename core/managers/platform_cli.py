@@ -6,10 +6,18 @@ from typing import Optional
 import argparse
 from core.managers.platform_manager import PlatformManager
 
-_pm = PlatformManager()
+_pm: Optional[PlatformManager] = None
 
 
-def main():
+def _get_platform_manager() -> PlatformManager:
+    """Create the PlatformManager (which scans plugins) on first use, so help/usage stays cheap."""
+    global _pm
+    if _pm is None:
+        _pm = PlatformManager()
+    return _pm
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="platform_cli")
     sub = parser.add_subparsers(dest="cmd")
 
@@ -25,28 +33,35 @@ def main():
     parser_delete = sub.add_parser("delete")
     parser_delete.add_argument("account")
     parser_delete.add_argument("platform")
+    return parser
+
 
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
+    if args.cmd is None:
+        parser.print_help()
+        return
+
+    pm = _get_platform_manager()
     if args.cmd == "list":
         if args.account:
-            print(_pm.list_platforms(account=args.account))
+            print(pm.list_platforms(account=args.account))
         else:
-            print(_pm.list_platforms())
+            print(pm.list_platforms())
     elif args.cmd == "create":
         try:
-            inst = _pm.create_platform_for_account(args.account, args.platform, api_key=args.api_key, api_secret=args.api_secret)
+            inst = pm.create_platform_for_account(args.account, args.platform, api_key=args.api_key, api_secret=args.api_secret)
             print(f"Created: account={args.account} platform={args.platform} -> {inst}")
         except Exception as e:
             print(f"Error: {e}")
     elif args.cmd == "delete":
         try:
             # simple delete
-            _pm.platforms.get(args.account, {}).pop(args.platform, None)
+            pm.platforms.get(args.account, {}).pop(args.platform, None)
             print(f"Deleted: account={args.account} platform={args.platform}")
         except Exception as e:
             print(f"Error: {e}")
-    else:
-        parser.print_help()
 
 
 if __name__ == "__main__":
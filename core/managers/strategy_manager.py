@@ -118,6 +118,9 @@ class StrategyManager:
         # 策略实例存储：{ account: { instance_id: StrategyInstance } }
         self.strategy_instances: Dict[str, Dict[str, StrategyInstance]] = {}
         
+        # 实例索引：{ (account, strategy_name, 标准化交易对): {instance_id} }，用于快速查重
+        self._instance_index: Dict[tuple, set] = {}
+        
         # 实例计数器
         self._instance_counter = 0
         
@@ -213,6 +216,25 @@ class StrategyManager:
         if account not in self.strategy_instances:
             self.strategy_instances[account] = {}
     
+    @staticmethod
+    def _instance_key(account: str, strategy_name: str, symbol: Any) -> tuple:
+        """生成实例索引键（交易对去掉'/'并转大写，OP/USDT与OPUSDT视为相同）"""
+        symbol = str(symbol or '').replace('/', '').upper()
+        return (account.upper(), strategy_name, symbol)
+    
+    def find_strategy_instances(self, account: str, strategy_name: str, symbol: Any) -> List[StrategyInstance]:
+        """按 账号+策略+交易对 查找已有的策略实例"""
+        key = self._instance_key(account, strategy_name, symbol)
+        instances = self.strategy_instances.get(key[0], {})
+        found = []
+        for instance_id in self._instance_index.get(key, ()):
+            instance = instances.get(instance_id)
+            # 实例参数可能在创建后被修改，这里再核对一次
+            if (instance is not None and instance.strategy_name == strategy_name and
+                    self._instance_key(key[0], strategy_name, instance.parameters.get('symbol')) == key):
+                found.append(instance)
+        return found
+    
     def _generate_instance_id(self, strategy_name: str) -> str:
         """生成策略实例ID"""
         self._instance_counter += 1
@@ -448,6 +470,9 @@ class StrategyManager:
             # 存储实例
             self._ensure_account_slot(account)
             self.strategy_instances[account][instance_id] = wrapper
+            self._instance_index.setdefault(
+                self._instance_key(account, strategy_name, final_params.get('symbol')), set()
+            ).add(instance_id)
             
             # 更新账号状态
             try:
@@ -555,6 +580,12 @@ class StrategyManager:
                 
                 # 移除实例
                 del self.strategy_instances[account][instance_id]
+                key = self._instance_key(account, instance.strategy_name, instance.parameters.get('symbol'))
+                indexed = self._instance_index.get(key)
+                if indexed is not None:
+                    indexed.discard(instance_id)
+                    if not indexed:
+                        del self._instance_index[key]
                 
                 logger.log_info(f"🗑️  Removed strategy instance: {account}/{instance_id}")
                 return True
@@ -696,51 +727,54 @@ class StrategyManager:
     
     def get_strategy_status_summary(self) -> Dict[str, Any]:
         """获取策略状态摘要"""
-        summary = {
-            "total_instances": 0,
-            "running": 0,
-            "paused": 0,
-            "stopped": 0,
-            "error": 0,
-            "by_account": {}
-        }
+        # 计数使用局部变量累加，循环结束后一次性写入结果字典
+        total_instances = 0
+        total_running = total_paused = total_stopped = total_error = 0
+        by_account = {}
         
         for account, instances in self.strategy_instances.items():
-            account_summary = {
-                "total": len(instances),
-                "running": 0,
-                "paused": 0,
-                "stopped": 0,
-                "error": 0,
-                "strategies": []
-            }
+            running = paused = stopped = error = 0
+            strategies = []
             
             for instance_id, instance in instances.items():
                 status = instance.strategy.status
-                account_summary["strategies"].append({
+                strategies.append({
                     "instance_id": instance_id,
                     "name": instance.strategy.name,
                     "status": status.value
                 })
                 
                 if status == StrategyStatus.RUNNING:
-                    account_summary["running"] += 1
-                    summary["running"] += 1
+                    running += 1
                 elif status == StrategyStatus.PAUSED:
-                    account_summary["paused"] += 1
-                    summary["paused"] += 1
+                    paused += 1
                 elif status == StrategyStatus.STOPPED:
-                    account_summary["stopped"] += 1
-                    summary["stopped"] += 1
+                    stopped += 1
                 elif status == StrategyStatus.ERROR:
-                    account_summary["error"] += 1
-                    summary["error"] += 1
-                
-                summary["total_instances"] += 1
+                    error += 1
             
-            summary["by_account"][account] = account_summary
+            by_account[account] = {
+                "total": len(instances),
+                "running": running,
+                "paused": paused,
+                "stopped": stopped,
+                "error": error,
+                "strategies": strategies
+            }
+            total_instances += len(instances)
+            total_running += running
+            total_paused += paused
+            total_stopped += stopped
+            total_error += error
         
-        return summary
+        return {
+            "total_instances": total_instances,
+            "running": total_running,
+            "paused": total_paused,
+            "stopped": total_stopped,
+            "error": total_error,
+            "by_account": by_account
+        }
     
     def reload_plugins(self):
         """重新加载策略插件"""
@@ -163,10 +163,12 @@ class StateManager:
             # 转换为字典格式
             state_dict = self._account_state_to_dict(state)
             
+            # 一次序列化为字节，单次写入临时文件（快照复用同一份数据）
+            payload = json.dumps(state_dict, ensure_ascii=False, indent=2, default=self._json_serializer).encode('utf-8')
+            
             # 原子写入
             temp_file = state_file.parent / f".{state_file.name}.tmp"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(state_dict, f, ensure_ascii=False, indent=2, default=self._json_serializer)
+            temp_file.write_bytes(payload)
             
             # 原子替换
             temp_file.replace(state_file)
@@ -177,7 +179,7 @@ class StateManager:
             
             # 创建快照（可选）
             if create_snapshot:
-                self._create_snapshot(account, state_dict)
+                self._create_snapshot(account, payload)
             
             logger.log_info(f"💾 Saved state for account: {account}")
             return True
@@ -497,15 +499,14 @@ class StateManager:
         else:
             raise ValueError(f"Cannot set field: {key_path}")
     
-    def _create_snapshot(self, account: str, state_dict: Dict[str, Any]):
-        """创建状态快照"""
+    def _create_snapshot(self, account: str, payload: bytes):
+        """创建状态快照（payload为已序列化的状态JSON）"""
         try:
             history_path = self.get_history_path(account)
             timestamp = int(time.time())
             snapshot_file = history_path / f"snapshot_{timestamp}.json"
             
-            with open(snapshot_file, 'w', encoding='utf-8') as f:
-                json.dump(state_dict, f, ensure_ascii=False, indent=2, default=self._json_serializer)
+            snapshot_file.write_bytes(payload)
             
             logger.log_info(f"📸 Created snapshot for account {account}: {snapshot_file.name}")
             
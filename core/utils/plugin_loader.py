@@ -103,6 +103,13 @@ class PluginLoader:
         
         # 插件文件修改时间缓存（用于热重载检测）
         self._file_mtimes: Dict[str, float] = {}
+        
+        # 插件/模板配置文件缓存：{file_path: (mtime_ns, 原始字节)}，文件未修改时不重新读盘
+        # 缓存字节而非dict，每次重新解析得到全新对象，调用方修改返回值不会影响缓存
+        self._plugin_config_cache: Dict[str, Tuple[int, bytes]] = {}
+        
+        # 各策略模板目录的文件签名：{strategy_name: ((file_name, mtime_ns), ...)}
+        self._template_signatures: Dict[str, Tuple[Tuple[str, int], ...]] = {}
     
     def scan_platform_plugins(self, force_reload: bool = False) -> Dict[str, Dict[str, Any]]:
         """
@@ -305,13 +312,22 @@ class PluginLoader:
         return has_updates
     
     def _load_plugin_config(self, plugin_file: Path) -> Optional[Dict[str, Any]]:
-        """加载插件配置文件"""
+        """加载插件配置文件（文件未修改时复用缓存的内容，不重新读盘）"""
         try:
-            with open(plugin_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            file_path = str(plugin_file)
+            file_stat = plugin_file.stat()
+            
+            cached = self._plugin_config_cache.get(file_path)
+            if cached is not None and cached[0] == file_stat.st_mtime_ns:
+                raw = cached[1]
+            else:
+                with open(plugin_file, 'rb') as f:
+                    raw = f.read()
+                self._plugin_config_cache[file_path] = (file_stat.st_mtime_ns, raw)
+            config = json.loads(raw.decode('utf-8'))
             
             # 记录文件修改时间
-            self._file_mtimes[str(plugin_file)] = plugin_file.stat().st_mtime
+            self._file_mtimes[file_path] = file_stat.st_mtime
             
             return config
         except json.JSONDecodeError as e:
@@ -354,36 +370,45 @@ class PluginLoader:
         Returns:
             Dict[template_id, template_config]
         """
-        if not force_reload and strategy_name in self._strategy_templates:
+        strategy_dir = self.strategy_base_path / strategy_name / "plugins"
+        
+        # 模板文件（除了strategy.json）及其修改时间，只stat不解析
+        template_files = []
+        if strategy_dir.exists():
+            template_files = [(f, f.stat().st_mtime_ns) for f in sorted(strategy_dir.glob("*.json"))
+                              if f.name != "strategy.json"]
+        signature = tuple((f.name, mtime) for f, mtime in template_files)
+        
+        if (not force_reload and strategy_name in self._strategy_templates and
+                self._template_signatures.get(strategy_name) == signature):
             return self._strategy_templates[strategy_name].copy()
         
         templates = {}
-        strategy_dir = self.strategy_base_path / strategy_name / "plugins"
+        # 上次扫描时各模板文件的修改时间，只对有变化的文件输出加载日志
+        previous_mtimes = dict(self._template_signatures.get(strategy_name, ()))
         
-        if strategy_dir.exists():
-            # 扫描模板文件（除了strategy.json）
-            for template_file in strategy_dir.glob("*.json"):
-                if template_file.name == "strategy.json":
+        for template_file, mtime in template_files:
+            try:
+                # 未修改的文件由 _load_plugin_config 从缓存的字节解析，不重新读盘
+                config = self._load_plugin_config(template_file)
+                if not config:
                     continue
                     
-                try:
-                    config = self._load_plugin_config(template_file)
-                    if not config:
-                        continue
-                    
-                    # 验证模板配置
-                    if "id" not in config or "name" not in config or "parameters" not in config:
-                        logger.log_warning(f"Invalid template format in {template_file}: missing required fields")
-                        continue
-                    
-                    template_id = config["id"]
-                    templates[template_id] = config
+                # 验证模板配置
+                if "id" not in config or "name" not in config or "parameters" not in config:
+                    logger.log_warning(f"Invalid template format in {template_file}: missing required fields")
+                    continue
+                
+                template_id = config["id"]
+                templates[template_id] = config
+                if force_reload or previous_mtimes.get(template_file.name) != mtime:
                     logger.log_info(f"✅ Loaded strategy template: {strategy_name}/{template_id}")
-                    
-                except Exception as e:
-                    logger.log_error(f"Failed to load strategy template {template_file}: {e}")
+                
+            except Exception as e:
+                logger.log_error(f"Failed to load strategy template {template_file}: {e}")
         
         self._strategy_templates[strategy_name] = templates
+        self._template_signatures[strategy_name] = signature
         return templates.copy()
     
     def get_strategy_templates(self, strategy_name: str) -> Dict[str, Dict[str, Any]]:
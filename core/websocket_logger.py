@@ -13,11 +13,16 @@ class WebSocketLogHandler(logging.Handler):
     def __init__(self):
         super().__init__()
         self.websocket_broadcast_func: Optional[Callable] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         
     def set_broadcast_func(self, func: Callable):
         """设置WebSocket广播函数"""
         self.websocket_broadcast_func = func
         
+    def set_event_loop(self, loop: asyncio.AbstractEventLoop):
+        """设置广播所在的事件循环（启动时记录），供工作线程中的日志投递使用"""
+        self.loop = loop
+        
     def emit(self, record):
         """发送日志记录到WebSocket"""
         if not self.websocket_broadcast_func:
@@ -44,18 +49,20 @@ class WebSocketLogHandler(logging.Handler):
             }
             
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.websocket_broadcast_func(websocket_message))
-                else:
-                    # 如果当前线程没有事件循环，创建一个临时的任务
-                    asyncio.run_coroutine_threadsafe(
-                        self.websocket_broadcast_func(websocket_message),
-                        loop
-                    )
-            except Exception:
-                # 如果无法获取事件循环，则忽略WebSocket推送
-                pass
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            
+            if running_loop is not None:
+                # 在事件循环线程中，直接创建任务
+                running_loop.create_task(self.websocket_broadcast_func(websocket_message))
+            elif self.loop is not None and self.loop.is_running() and not self.loop.is_closed():
+                # 在工作线程中（如 asyncio.to_thread），线程安全地投递到启动时记录的事件循环
+                asyncio.run_coroutine_threadsafe(
+                    self.websocket_broadcast_func(websocket_message),
+                    self.loop
+                )
+            # 没有可用的事件循环时忽略WebSocket推送
                 
         except Exception as e:
             # 避免日志错误影响主程序